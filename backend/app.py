@@ -1,4 +1,4 @@
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, request, jsonify, send_file, g
 from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
 from flask_bcrypt import Bcrypt
@@ -6,14 +6,29 @@ import jwt
 import os
 import json
 import io
+import itertools
 import csv
+import multiprocessing
+import hashlib
+import secrets
+import shutil
+import tempfile
+import zipfile
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta
 from functools import wraps
 import openpyxl
 from openpyxl.styles import Font, PatternFill, Alignment
-from sqlalchemy import text
+from sqlalchemy import event, text
 from werkzeug.exceptions import BadRequest
 import traceback
+import threading
+import queue
+import time
+
+from profile_format import SKILLS_MASTER, normalize_skills_list, _safe_json_loads, _format_export_chunk
 
 app = Flask(__name__)
 CORS(app, origins=os.environ.get("CORS_ORIGIN", "*"))
@@ -50,7 +65,70 @@ def _to_int_or_none(val):
     except Exception:
         return None
 
+def _to_float_or_none(val):
+    if val is None or isinstance(val, bool):
+        return None
+    if isinstance(val, (int, float)):
+        return float(val)
+    s = str(val).strip()
+    if s == '':
+        return None
+    try:
+        return float(s)
+    except Exception:
+        return None
+
+def _env_int(name, default):
+    val = _to_int_or_none(os.environ.get(name))
+    return default if val is None else val
+
+def _env_float(name, default):
+    val = _to_float_or_none(os.environ.get(name))
+    return default if val is None else val
+
+# Set DB_ENGINE_TUNING=0 to fall back to SQLAlchemy/driver defaults.
+DB_ENGINE_TUNING = os.environ.get('DB_ENGINE_TUNING', '1').strip().lower() not in {'0', 'false', 'no'}
+
+def _engine_options(url: str) -> dict:
+    """Per-backend SQLAlchemy engine settings (pool sizing for Postgres, lock timeout for SQLite)."""
+    if not DB_ENGINE_TUNING:
+        return {}
+    if url.startswith('postgresql'):
+        return {
+            'pool_size': _env_int('DB_POOL_SIZE', 5),
+            'max_overflow': _env_int('DB_MAX_OVERFLOW', 10),
+            'pool_timeout': _env_int('DB_POOL_TIMEOUT', 30),
+            # Managed Postgres/load balancers drop idle connections; recycle before they do.
+            'pool_recycle': _env_int('DB_POOL_RECYCLE', 1800),
+            'pool_pre_ping': True,
+            'connect_args': {
+                'connect_timeout': _env_int('DB_CONNECT_TIMEOUT', 10),
+                'options': f"-c statement_timeout={_env_int('DB_STATEMENT_TIMEOUT_MS', 30000)}",
+            },
+        }
+    if url.startswith('sqlite'):
+        # Pragmas are applied per connection in _sqlite_on_connect.
+        return {'connect_args': {'timeout': _env_int('SQLITE_BUSY_TIMEOUT_MS', 5000) / 1000.0}}
+    return {'pool_pre_ping': True}
+
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = _engine_options(app.config['SQLALCHEMY_DATABASE_URI'])
+
+def _sqlite_on_connect(dbapi_connection, connection_record):
+    """WAL lets readers run alongside a writer; NORMAL sync is safe in WAL and skips an fsync per commit."""
+    cur = dbapi_connection.cursor()
+    cur.execute('PRAGMA journal_mode=WAL')
+    cur.execute('PRAGMA synchronous=NORMAL')
+    cur.execute(f"PRAGMA busy_timeout={_env_int('SQLITE_BUSY_TIMEOUT_MS', 5000)}")
+    cur.execute(f"PRAGMA mmap_size={_env_int('SQLITE_MMAP_SIZE', 256 * 1024 * 1024)}")
+    cur.close()
+
 db = SQLAlchemy(app)
+
+if DB_ENGINE_TUNING:
+    with app.app_context():
+        if db.engine.dialect.name == 'sqlite':
+            event.listen(db.engine, 'connect', _sqlite_on_connect)
+
 bcrypt = Bcrypt(app)
 
 # ─── Models ─────────────────────────────────────────────────────────────────
@@ -60,6 +138,10 @@ class AdminUser(db.Model):
     username = db.Column(db.String(80), unique=True, nullable=False)
     password_hash = db.Column(db.String(200), nullable=False)
 
+class RevokedToken(db.Model):
+    token_digest = db.Column(db.String(64), primary_key=True)  # sha256 of the JWT
+    expires_at = db.Column(db.DateTime, nullable=False)
+
 class Profile(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     hm_id = db.Column(db.String(50), unique=True, nullable=False)
@@ -81,89 +163,130 @@ class Profile(db.Model):
     skills = db.Column(db.Text)      # JSON array
     certifications = db.Column(db.Text)  # JSON array
     projects = db.Column(db.Text)    # JSON array
+    content_hash = db.Column(db.String(64))  # sha256 of normalized submitted content
     approved = db.Column(db.Boolean, default=False)
     approved_at = db.Column(db.DateTime)
+    # Rollup bucket the current approval was counted in, so it can be retracted there
+    approved_competency = db.Column(db.String(20))
+    approved_primary_role = db.Column(db.String(100))
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-# ─── Skills master helpers ───────────────────────────────────────────────────
+class ProfileRollup(db.Model):
+    """Per-day submission/update/approval counts, maintained on write for trend charts."""
+    __table_args__ = (db.UniqueConstraint('bucket_date', 'competency', 'primary_role', name='uq_profile_rollup_bucket'),)
+    id = db.Column(db.Integer, primary_key=True)
+    bucket_date = db.Column(db.Date, nullable=False)
+    competency = db.Column(db.String(20), nullable=False, default='')
+    primary_role = db.Column(db.String(100), nullable=False, default='')
+    submitted = db.Column(db.Integer, nullable=False, default=0)
+    updated = db.Column(db.Integer, nullable=False, default=0)
+    approved = db.Column(db.Integer, nullable=False, default=0)
 
-def _skill_master_lookup_by_name(name: str):
-    if not name:
-        return None
-    n = str(name).strip().lower()
-    if not n:
-        return None
-    for s in SKILLS_MASTER:
-        if s.get('skill_name', '').strip().lower() == n:
-            return s
-    return None
+# ─── Auth ────────────────────────────────────────────────────────────────────
+
+ADMIN_TOKEN_HOURS = 8
+TOKEN_CACHE_MAX = _env_int('TOKEN_CACHE_MAX', 1024)
+# How stale another worker's view of the revocation list may get.
+TOKEN_REVOCATION_REFRESH_S = _env_float('TOKEN_REVOCATION_REFRESH_S', 5)
+
+def _token_digest(token):
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+class TokenCache:
+    """LRU of verified JWT claims keyed by token digest; entries expire at the token's exp."""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
 
-def normalize_skills_list(skills):
-    """Normalize incoming/outgoing skills to structured objects.
+    def get(self, digest):
+        with self._lock:
+            claims = self._entries.get(digest)
+            if claims is None:
+                return None
+            if claims['exp'] <= time.time():
+                del self._entries[digest]
+                return None
+            self._entries.move_to_end(digest)
+            return claims
 
-    Backward compatible with older entries like:
-    - "Python"
-    - {"skill_name": "Python", ...}
+    def put(self, digest, claims):
+        if not isinstance(claims.get('exp'), (int, float)):
+            return
+        with self._lock:
+            self._entries[digest] = claims
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, digest):
+        with self._lock:
+            self._entries.pop(digest, None)
+
+class RevocationList:
+    """Revoked token digests: stored in the DB, mirrored in a per-process set for O(1) checks.
+
+    Revocations made in this process apply immediately; the mirror is reloaded at most
+    every TOKEN_REVOCATION_REFRESH_S to pick up revocations from other workers.
     """
-    if not isinstance(skills, list):
-        return []
-
-    normalized = []
-    seen = set()
-
-    for item in skills:
-        if isinstance(item, str):
-            obj = {
-                'skill_id': None,
-                'skill_name': item,
-                'platform_group': None,
-                'primary_secondary': 'Primary',
-                'years_exp': '',
-                'self_assessment': '',
-            }
-        elif isinstance(item, dict):
-            obj = {
-                'skill_id': item.get('skill_id'),
-                'skill_name': item.get('skill_name') or item.get('name') or '',
-                'platform_group': item.get('platform_group'),
-                'primary_secondary': item.get('primary_secondary') or item.get('primary') or 'Primary',
-                'years_exp': item.get('years_exp', ''),
-                'self_assessment': item.get('self_assessment', ''),
-            }
-        else:
-            continue
 
-        # Enrich from master list if missing
-        if (not obj.get('skill_id') or not obj.get('platform_group')) and obj.get('skill_name'):
-            m = _skill_master_lookup_by_name(obj.get('skill_name'))
-            if m:
-                obj['skill_id'] = obj.get('skill_id') or m.get('skill_id')
-                obj['platform_group'] = obj.get('platform_group') or m.get('platform_group')
+    def __init__(self, refresh_s):
+        self.refresh_s = refresh_s
+        self._digests = set()
+        self._loaded_at = None
+        self._lock = threading.Lock()
 
-        # Deduplicate
-        dedupe_key = (obj.get('skill_id') or obj.get('skill_name') or '').strip().lower()
-        if not dedupe_key or dedupe_key in seen:
-            continue
-        seen.add(dedupe_key)
-        normalized.append(obj)
+    def is_revoked(self, digest):
+        now = time.monotonic()
+        if self._loaded_at is None or now - self._loaded_at > self.refresh_s:
+            rows = db.session.query(RevokedToken.token_digest).filter(
+                RevokedToken.expires_at > datetime.utcnow()).all()
+            with self._lock:
+                self._digests = {r[0] for r in rows}
+                self._loaded_at = now
+        return digest in self._digests
 
-    return normalized
+    def revoke(self, digest, exp):
+        expires_at = datetime.utcfromtimestamp(exp)
+        RevokedToken.query.filter(RevokedToken.expires_at <= datetime.utcnow()).delete()
+        if not db.session.get(RevokedToken, digest):
+            db.session.add(RevokedToken(token_digest=digest, expires_at=expires_at))
+        db.session.commit()
+        with self._lock:
+            self._digests.add(digest)
 
-# ─── Auth ────────────────────────────────────────────────────────────────────
+token_cache = TokenCache(TOKEN_CACHE_MAX)
+revocation_list = RevocationList(TOKEN_REVOCATION_REFRESH_S)
 
 def token_required(f):
+    """Verify the admin bearer token and expose its claims as g.token_claims / g.admin_user.
+
+    Verified claims are cached by token digest until exp, so dashboard bursts skip
+    re-verifying the same token; revoked tokens are rejected before the cache is consulted.
+    """
     @wraps(f)
     def decorated(*args, **kwargs):
-        token = request.headers.get('Authorization', '').replace('Bearer ', '')
+        auth = request.headers.get('Authorization', '')
+        token = (auth[7:] if auth[:7].lower() == 'bearer ' else auth).strip()
         if not token:
             return jsonify({'error': 'Token missing'}), 401
-        try:
-            jwt.decode(token, app.config['SECRET_KEY'], algorithms=['HS256'])
-        except jwt.ExpiredSignatureError:
-            return jsonify({'error': 'Token expired'}), 401
-        except jwt.InvalidTokenError:
-            return jsonify({'error': 'Invalid token'}), 401
+        digest = _token_digest(token)
+        if revocation_list.is_revoked(digest):
+            return jsonify({'error': 'Token revoked'}), 401
+        claims = token_cache.get(digest)
+        if claims is None:
+            try:
+                claims = jwt.decode(token, app.config['SECRET_KEY'], algorithms=['HS256'])
+            except jwt.ExpiredSignatureError:
+                return jsonify({'error': 'Token expired'}), 401
+            except jwt.InvalidTokenError:
+                return jsonify({'error': 'Invalid token'}), 401
+            token_cache.put(digest, claims)
+        g.token_digest = digest
+        g.token_claims = claims
+        g.admin_user = claims.get('sub')
         return f(*args, **kwargs)
     return decorated
 
@@ -199,13 +322,378 @@ def admin_login():
     if user and bcrypt.check_password_hash(user.password_hash, data.get('password', '')):
         token = jwt.encode({
             'sub': user.username,
-            'exp': datetime.utcnow() + timedelta(hours=8)
+            # Unique per login so revoking one session never matches a later token.
+            'jti': secrets.token_hex(16),
+            'exp': datetime.utcnow() + timedelta(hours=ADMIN_TOKEN_HOURS)
         }, app.config['SECRET_KEY'], algorithm='HS256')
         return jsonify({'token': token})
     return jsonify({'error': 'Invalid credentials'}), 401
 
+@app.route('/api/admin/logout', methods=['POST'])
+@token_required
+def admin_logout():
+    exp = g.token_claims.get('exp') or (datetime.utcnow() + timedelta(hours=ADMIN_TOKEN_HOURS)).timestamp()
+    revocation_list.revoke(g.token_digest, exp)
+    token_cache.discard(g.token_digest)
+    return jsonify({'message': 'Logged out'})
+
+# ─── Trend rollups ───────────────────────────────────────────────────────────
+
+ROLLUP_COUNTS = ('submitted', 'updated', 'approved')
+
+def _rollup_key(when, competency, primary_role):
+    return (when.date(), str(competency or '')[:20], str(primary_role or '')[:100])
+
+def _bump_rollup(when, competency, primary_role, **deltas):
+    """Add deltas to the (day, competency, primary_role) rollup row in the current transaction."""
+    _upsert_rollup(_rollup_key(when, competency, primary_role), deltas)
+
+def _upsert_rollup(key, deltas):
+    bucket_date, competency, primary_role = key
+    values = {'bucket_date': bucket_date, 'competency': competency, 'primary_role': primary_role}
+    values.update({c: deltas.get(c, 0) for c in ROLLUP_COUNTS})
+    table = ProfileRollup.__table__
+    dialect = db.session.get_bind().dialect.name
+    if dialect in ('postgresql', 'sqlite'):
+        if dialect == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        stmt = insert(table).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['bucket_date', 'competency', 'primary_role'],
+            set_={c: table.c[c] + stmt.excluded[c] for c in ROLLUP_COUNTS},
+        )
+        db.session.execute(stmt)
+        return
+    row = ProfileRollup.query.filter_by(bucket_date=values['bucket_date'], competency=values['competency'],
+                                        primary_role=values['primary_role']).first()
+    if row is None:
+        db.session.add(ProfileRollup(**values))
+    else:
+        for c in ROLLUP_COUNTS:
+            setattr(row, c, getattr(row, c) + values[c])
+
+def _write_rollup(events):
+    """Apply (key, count) events collected by _apply_profile_submission.
+
+    Runs in its own short transaction after the profiles are committed, so the
+    hot (today, competency, role) rows are only locked for the counter update and
+    not for the whole submission. Keys are written in sorted order so concurrent
+    writers lock them in the same order. If this fails the submissions stand and
+    only their counts are lost.
+    """
+    if not events:
+        return
+    counts = defaultdict(lambda: dict.fromkeys(ROLLUP_COUNTS, 0))
+    for key, count in events:
+        counts[key][count] += 1
+    try:
+        for key in sorted(counts):
+            _upsert_rollup(key, counts[key])
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print('❌ Rollup update failed:', repr(e))
+        traceback.print_exc()
+
+def _retract_approval(profile):
+    """Undo a profile's approval count in the current transaction, if it has one.
+
+    Approvals are bucketed by approved_at and the competency/role at approval time,
+    so the count comes out of the bucket it went into even if the profile changed since.
+    """
+    if not profile.approved_at:
+        return
+    _bump_rollup(profile.approved_at,
+                 profile.approved_competency if profile.approved_competency is not None else profile.competency,
+                 profile.approved_primary_role if profile.approved_primary_role is not None else profile.primary_role,
+                 approved=-1)
+
+def backfill_profile_rollups():
+    """Rebuild the rollup table from profile timestamps.
+
+    Submissions are bucketed by created_at and approvals by approved_at. Past
+    updates can't be recovered (updated_at is also bumped by approvals), so the
+    seeded `updated` counts are zero and only updates made from now on are counted.
+    """
+    counts = defaultdict(lambda: dict.fromkeys(ROLLUP_COUNTS, 0))
+    rows = (db.session.query(Profile.competency, Profile.primary_role, Profile.created_at,
+                             Profile.approved_at, Profile.approved_competency,
+                             Profile.approved_primary_role)
+            .yield_per(EXPORT_BATCH_SIZE))
+    for (competency, primary_role, created_at, approved_at,
+         approved_competency, approved_primary_role) in rows:
+        def bucket(dt, comp, role):
+            return counts[_rollup_key(dt, comp, role)]
+        if created_at:
+            bucket(created_at, competency, primary_role)['submitted'] += 1
+        if approved_at:
+            bucket(approved_at,
+                   approved_competency if approved_competency is not None else competency,
+                   approved_primary_role if approved_primary_role is not None else primary_role)['approved'] += 1
+    ProfileRollup.query.delete()
+    db.session.add_all([
+        ProfileRollup(bucket_date=day, competency=competency, primary_role=primary_role, **c)
+        for (day, competency, primary_role), c in counts.items()
+    ])
+    db.session.commit()
+    return len(counts)
+
+# ─── Submission group commit ─────────────────────────────────────────────────
+
+# Optional write coalescing for submission bursts. Submissions are validated in
+# the request thread, queued, and applied by a background thread in batches of up
+# to SUBMIT_BATCH_MAX, each batch in one transaction. Only useful when a worker
+# process serves concurrent requests (e.g. gunicorn --threads).
+SUBMIT_GROUP_COMMIT = os.environ.get('SUBMIT_GROUP_COMMIT', '').strip().lower() in {'1', 'true', 'yes'}
+SUBMIT_BATCH_MAX = _env_int('SUBMIT_BATCH_MAX', 64)
+SUBMIT_BATCH_WAIT_MS = _env_float('SUBMIT_BATCH_WAIT_MS', 5)
+SUBMIT_TIMEOUT_S = _env_float('SUBMIT_TIMEOUT_S', 30)
+
+class _PendingSubmission:
+    __slots__ = ('hm_id', 'data', 'done', 'result', 'claimed', 'cancelled')
+
+    def __init__(self, hm_id, data):
+        self.hm_id = hm_id
+        self.data = data
+        self.done = threading.Event()
+        self.result = None
+        # Guarded by SubmissionBatcher._claim_lock: the batcher claims an item
+        # before writing it, a timed-out caller cancels it only if unclaimed.
+        self.claimed = False
+        self.cancelled = False
+
+class SubmissionBatcher:
+    def __init__(self, max_batch, max_wait_ms):
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._claim_lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+
+    def submit(self, hm_id, data):
+        """Queue one submission and block until its batch is committed.
+
+        Returns the same (body, status) pair the synchronous path produces.
+        """
+        item = _PendingSubmission(hm_id, data)
+        self._ensure_started()
+        self._queue.put(item)
+        if not item.done.wait(SUBMIT_TIMEOUT_S):
+            with self._claim_lock:
+                if not item.claimed:
+                    item.cancelled = True
+                    return {'error': 'Submission timed out, please retry'}, 503
+            # Already in a batch being written: its outcome is about to be known,
+            # and a 503 here would lie if the commit goes through.
+            item.done.wait()
+        return item.result
+
+    def _ensure_started(self):
+        # Started lazily so that each gunicorn worker (forked after --preload) gets its own thread.
+        with self._lock:
+            if self._thread is None or self._pid != os.getpid() or not self._thread.is_alive():
+                if self._pid != os.getpid():
+                    self._queue = queue.Queue()
+                self._pid = os.getpid()
+                self._thread = threading.Thread(target=self._run, name='submission-batcher', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                with app.app_context():
+                    self._flush(batch)
+            except Exception:
+                traceback.print_exc()
+            finally:
+                for item in batch:
+                    if item.result is None:
+                        item.result = ({'error': 'Internal server error'}, 500)
+                    item.done.set()
+
+    def _flush(self, batch):
+        with self._claim_lock:
+            batch = [item for item in batch if not item.cancelled]
+            for item in batch:
+                item.claimed = True
+        if not batch:
+            return
+        rollup = []
+        try:
+            results = [_apply_profile_submission(item.hm_id, item.data, rollup) for item in batch]
+            db.session.commit()
+        except Exception:
+            # One bad submission must not fail its neighbours: replay the batch one
+            # transaction per item so each caller gets its own outcome.
+            db.session.rollback()
+            results, rollup = [], []
+            for item in batch:
+                item_rollup = []
+                try:
+                    result = _apply_profile_submission(item.hm_id, item.data, item_rollup)
+                    db.session.commit()
+                    rollup.extend(item_rollup)
+                except Exception as e:
+                    db.session.rollback()
+                    print('❌ API error:', repr(e))
+                    traceback.print_exc()
+                    result = ({'error': 'Internal server error'}, 500)
+                results.append(result)
+        # One rollup transaction per batch, summed across its submissions.
+        _write_rollup(rollup)
+        for item, result in zip(batch, results):
+            item.result = result
+
+submission_batcher = SubmissionBatcher(SUBMIT_BATCH_MAX, SUBMIT_BATCH_WAIT_MS)
+
+# ─── Idempotency ─────────────────────────────────────────────────────────────
+
+IDEMPOTENCY_TTL_S = _env_float('IDEMPOTENCY_TTL_S', 600)
+IDEMPOTENCY_MAX_KEYS = _env_int('IDEMPOTENCY_MAX_KEYS', 10000)
+# How long a duplicate request waits for the original to finish before a 409.
+IDEMPOTENCY_WAIT_S = _env_float('IDEMPOTENCY_WAIT_S', 30)
+
+class _IdempotencyEntry:
+    __slots__ = ('payload_hash', 'expires', 'done', 'response')
+
+    def __init__(self, payload_hash, expires):
+        self.payload_hash = payload_hash
+        self.expires = expires
+        self.done = threading.Event()
+        self.response = None
+
+class IdempotencyStore:
+    """Bounded, TTL-evicted map of Idempotency-Key -> (body, status), per process.
+
+    The first request with a key owns it; concurrent duplicates wait for the
+    owner's response instead of running the submission again.
+    """
+
+    def __init__(self, ttl_s, max_keys):
+        self.ttl = ttl_s
+        self.max_keys = max_keys
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def begin(self, key, payload_hash):
+        """Return (entry, owner). If owner is False, wait on entry.done and replay entry.response."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= now:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                return entry, False
+            entry = _IdempotencyEntry(payload_hash, now + self.ttl)
+            self._entries[key] = entry
+            self._evict(now)
+            return entry, True
+
+    def finish(self, entry, response):
+        entry.response = response
+        entry.done.set()
+
+    def abort(self, key, entry):
+        # Don't remember failures; a retry with the same key should run again.
+        with self._lock:
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+        entry.done.set()
+
+    def _evict(self, now):
+        # Entries are inserted in expiry order, so expired ones are at the front.
+        while self._entries:
+            oldest_key, oldest = next(iter(self._entries.items()))
+            if oldest.expires > now and len(self._entries) <= self.max_keys:
+                break
+            del self._entries[oldest_key]
+
+idempotency_store = IdempotencyStore(IDEMPOTENCY_TTL_S, IDEMPOTENCY_MAX_KEYS)
+
 # ─── Profile Routes ──────────────────────────────────────────────────────────
 
+PROFILE_TEXT_FIELDS = ['competency', 'joining_date', 'reporting_location_type', 'customer_name',
+                       'customer_address', 'office_city', 'primary_role', 'profile_pic']
+PROFILE_INT_FIELDS = ['total_exp_years', 'total_exp_months', 'relevant_exp_years', 'relevant_exp_months']
+PROFILE_JSON_FIELDS = ['industries', 'education', 'skills', 'certifications', 'projects']
+PROFILE_CONTENT_FIELDS = ['name'] + PROFILE_TEXT_FIELDS + PROFILE_INT_FIELDS + PROFILE_JSON_FIELDS
+
+def _normalized_profile_values(data):
+    """Column values a submission maps to, with defaults for missing fields."""
+    values = {'name': data.get('name', '')}
+    for field in PROFILE_TEXT_FIELDS:
+        values[field] = data.get(field)
+    for field in PROFILE_INT_FIELDS:
+        values[field] = _to_int_or_none(data.get(field))
+    for field in PROFILE_JSON_FIELDS:
+        if field == 'skills':
+            values[field] = json.dumps(normalize_skills_list(data.get(field, [])))
+        else:
+            values[field] = json.dumps(data.get(field, []))
+    return values
+
+def _profile_content_hash(values):
+    canonical = json.dumps([values.get(f) for f in PROFILE_CONTENT_FIELDS], separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+def _apply_profile_submission(hm_id, data, rollup):
+    """Upsert a profile in the current session without committing.
+
+    Returns a (body, status) pair; the caller owns the transaction. Trend counts
+    are appended to `rollup` for the caller to pass to _write_rollup after commit.
+    """
+    values = _normalized_profile_values(data)
+    existing = Profile.query.filter_by(hm_id=hm_id).first()
+    if existing:
+        # Update only the fields that were sent
+        for field in PROFILE_CONTENT_FIELDS:
+            if field in data:
+                setattr(existing, field, values[field])
+        existing.content_hash = _profile_content_hash({f: getattr(existing, f) for f in PROFILE_CONTENT_FIELDS})
+        existing.updated_at = datetime.utcnow()
+        rollup.append((_rollup_key(existing.updated_at, existing.competency, existing.primary_role), 'updated'))
+        return {'message': 'Profile updated successfully', 'id': existing.id}, 200
+
+    profile = Profile(hm_id=hm_id, content_hash=_profile_content_hash(values), **values)
+    db.session.add(profile)
+    db.session.flush()
+    rollup.append((_rollup_key(profile.created_at, profile.competency, profile.primary_role), 'submitted'))
+    return {'message': 'Profile submitted successfully', 'id': profile.id}, 201
+
+def _submit_profile(hm_id, data, content_hash):
+    # A submission identical to the stored profile is a no-op: answer from the
+    # hash alone without loading the row or bumping updated_at.
+    current = db.session.query(Profile.id, Profile.content_hash).filter_by(hm_id=hm_id).first()
+    if current and current.content_hash == content_hash:
+        return {'message': 'Profile unchanged', 'id': current.id}, 200
+
+    if SUBMIT_GROUP_COMMIT:
+        # Give the connection back before blocking on the batch; otherwise enough
+        # waiting callers exhaust the pool and the batcher can't get one to commit.
+        db.session.close()
+        return submission_batcher.submit(hm_id, data)
+
+    rollup = []
+    result = _apply_profile_submission(hm_id, data, rollup)
+    db.session.commit()
+    _write_rollup(rollup)
+    return result
+
 @app.route('/api/profile', methods=['POST'])
 def submit_profile():
     data = request.get_json(silent=True)
@@ -215,52 +703,32 @@ def submit_profile():
     if not hm_id:
         return jsonify({'error': 'Happiest Minds ID is required'}), 400
 
-    existing = Profile.query.filter_by(hm_id=hm_id).first()
-    if existing:
-        # Update
-        int_fields = {'total_exp_years','total_exp_months','relevant_exp_years','relevant_exp_months'}
-        for field in ['name','competency','joining_date','total_exp_years','total_exp_months',
-                      'relevant_exp_years','relevant_exp_months','reporting_location_type',
-                      'customer_name','customer_address','office_city','primary_role','profile_pic']:
-            if field in data:
-                if field in int_fields:
-                    setattr(existing, field, _to_int_or_none(data[field]))
-                else:
-                    setattr(existing, field, data[field])
-        for json_field in ['industries','education','skills','certifications','projects']:
-            if json_field in data:
-                if json_field == 'skills':
-                    setattr(existing, json_field, json.dumps(normalize_skills_list(data[json_field])))
-                else:
-                    setattr(existing, json_field, json.dumps(data[json_field]))
-        existing.updated_at = datetime.utcnow()
-        db.session.commit()
-        return jsonify({'message': 'Profile updated successfully', 'id': existing.id})
-
-    profile = Profile(
-        hm_id=hm_id,
-        name=data.get('name', ''),
-        competency=data.get('competency'),
-        joining_date=data.get('joining_date'),
-        total_exp_years=_to_int_or_none(data.get('total_exp_years')),
-        total_exp_months=_to_int_or_none(data.get('total_exp_months')),
-        relevant_exp_years=_to_int_or_none(data.get('relevant_exp_years')),
-        relevant_exp_months=_to_int_or_none(data.get('relevant_exp_months')),
-        reporting_location_type=data.get('reporting_location_type'),
-        customer_name=data.get('customer_name'),
-        customer_address=data.get('customer_address'),
-        office_city=data.get('office_city'),
-        industries=json.dumps(data.get('industries', [])),
-        primary_role=data.get('primary_role'),
-        profile_pic=data.get('profile_pic'),
-        education=json.dumps(data.get('education', [])),
-        skills=json.dumps(normalize_skills_list(data.get('skills', []))),
-        certifications=json.dumps(data.get('certifications', [])),
-        projects=json.dumps(data.get('projects', [])),
-    )
-    db.session.add(profile)
-    db.session.commit()
-    return jsonify({'message': 'Profile submitted successfully', 'id': profile.id}), 201
+    content_hash = _profile_content_hash(_normalized_profile_values(data))
+    idem_key = request.headers.get('Idempotency-Key', '').strip()
+    if not idem_key:
+        body, status = _submit_profile(hm_id, data, content_hash)
+        return jsonify(body), status
+
+    store_key = f'{hm_id}:{idem_key}'
+    entry, owner = idempotency_store.begin(store_key, content_hash)
+    if not owner:
+        if entry.payload_hash != content_hash:
+            return jsonify({'error': 'Idempotency-Key was already used with a different payload'}), 422
+        if not entry.done.wait(IDEMPOTENCY_WAIT_S) or entry.response is None:
+            return jsonify({'error': 'Original request did not complete, please retry'}), 409
+        body, status = entry.response
+        return jsonify(body), status
+
+    try:
+        body, status = _submit_profile(hm_id, data, content_hash)
+    except Exception:
+        idempotency_store.abort(store_key, entry)
+        raise
+    if status >= 500:
+        idempotency_store.abort(store_key, entry)
+    else:
+        idempotency_store.finish(entry, (body, status))
+    return jsonify(body), status
 
 @app.route('/api/profile/<hm_id>', methods=['GET'])
 def get_profile(hm_id):
@@ -296,6 +764,9 @@ def list_profiles():
 @token_required
 def delete_profile(profile_id):
     profile = Profile.query.get_or_404(profile_id)
+    # Approval counts track profiles that are still approved, so take this one back
+    # out; submission/update counts record past events and are left as they are.
+    _retract_approval(profile)
     db.session.delete(profile)
     db.session.commit()
     return jsonify({'message': 'Deleted'})
@@ -306,157 +777,130 @@ def set_profile_approval(profile_id):
     profile = Profile.query.get_or_404(profile_id)
     data = request.json or {}
     approved = bool(data.get('approved'))
+    _retract_approval(profile)
     profile.approved = approved
     profile.approved_at = datetime.utcnow() if approved else None
+    profile.approved_competency = str(profile.competency or '')[:20] if approved else None
+    profile.approved_primary_role = str(profile.primary_role or '')[:100] if approved else None
+    if profile.approved_at:
+        _bump_rollup(profile.approved_at, profile.approved_competency, profile.approved_primary_role, approved=1)
     db.session.commit()
     return jsonify({'message': 'Updated', 'approved': profile.approved, 'approved_at': profile.approved_at.isoformat() if profile.approved_at else None})
 
-def _safe_json_loads(val, default):
-    try:
-        if val is None:
-            return default
-        if isinstance(val, (list, dict)):
-            return val
-        s = str(val).strip()
-        if not s:
-            return default
-        return json.loads(s)
-    except Exception:
-        return default
+EXPORT_BATCH_SIZE = _env_int('EXPORT_BATCH_SIZE', 500)
+# Worker processes used to format CSV/Excel rows; 0 or 1 disables the pool.
+EXPORT_WORKERS = _env_int('EXPORT_WORKERS', os.cpu_count() or 1)
+# Below this many profiles the pool's pickling overhead outweighs the gain.
+EXPORT_PARALLEL_MIN_ROWS = _env_int('EXPORT_PARALLEL_MIN_ROWS', 2000)
 
-def _fmt_join(values):
-    parts = []
-    for v in values or []:
-        s = (str(v) if v is not None else '').strip()
-        if s:
-            parts.append(s)
-    return '; '.join(parts)
+EXPORT_HEADERS = [
+    'HM ID','Name','Competency','Joining Date',
+    'Total Exp (Y)','Total Exp (M)','Relevant Exp (Y)','Relevant Exp (M)',
+    'Location Type','Customer Name','Customer Address','Office City',
+    'Primary Role','Industries',
+    'Education',
+    'Skills (Detailed)',
+    'Certifications (Detailed)',
+    'Projects (Detailed)',
+    'Has Profile Pic',
+    'Approved','Approved At','Created At','Updated At'
+]
 
-def _fmt_education(education):
-    rows = []
-    for e in education or []:
-        if not isinstance(e, dict):
-            continue
-        degree = (e.get('degree') or '').strip()
-        spec = (e.get('specialisation') or '').strip()
-        inst = (e.get('institution') or '').strip()
-        year = (e.get('year') or '').strip()
-        grade = (e.get('grade') or '').strip()
-        line = ' | '.join([p for p in [degree, spec, inst, year, grade] if p])
-        if line:
-            rows.append(line)
-    return '\n'.join(rows)
-
-def _fmt_skills(skills):
-    skills_norm = normalize_skills_list(skills or [])
-    rows = []
-    for s in skills_norm:
-        if not isinstance(s, dict):
-            continue
-        skill_id = (s.get('skill_id') or '').strip()
-        name = (s.get('skill_name') or '').strip()
-        group = (s.get('platform_group') or '').strip()
-        ps = (s.get('primary_secondary') or '').strip()
-        years = (str(s.get('years_exp')) if s.get('years_exp') is not None else '').strip()
-        sa = (s.get('self_assessment') or '').strip()
-        main = ' '.join([p for p in [skill_id, name] if p]).strip()
-        meta = _fmt_join([group, ps, (f"{years}y" if years else ''), sa])
-        line = f"{main} — {meta}" if meta else main
-        if line:
-            rows.append(line)
-    return '\n'.join(rows)
-
-def _fmt_certs(certs):
-    rows = []
-    for c in certs or []:
-        if not isinstance(c, dict):
-            continue
-        name = (c.get('name') or '').strip()
-        provider = (c.get('provider') or '').strip()
-        date = (c.get('date') or '').strip()
-        expiry = (c.get('expiry') or '').strip()
-        meta = _fmt_join([provider, (f"Obtained: {date}" if date else ''), (f"Expiry: {expiry}" if expiry else '')])
-        line = f"{name} — {meta}" if meta else name
-        if line:
-            rows.append(line)
-    return '\n'.join(rows)
-
-def _fmt_projects(projects):
-    rows = []
-    for pr in projects or []:
-        if not isinstance(pr, dict):
-            continue
-        title = (pr.get('title') or '').strip()
-        role = (pr.get('role') or '').strip()
-        duration = (pr.get('duration') or '').strip()
-        tools = (pr.get('tools') or '').strip()
-        desc = (pr.get('description') or '').strip()
-        resp = (pr.get('responsibility') or '').strip()
-        awards = (pr.get('awards') or '').strip()
-        header = ' | '.join([p for p in [title, role, duration] if p]).strip()
-        details = []
-        if tools:
-            details.append(f"Tools: {tools}")
-        if desc:
-            details.append(f"Desc: {desc}")
-        if resp:
-            details.append(f"Resp: {resp}")
-        if awards:
-            details.append(f"Awards: {awards}")
-        if header and details:
-            rows.append(header + "\n" + '\n'.join(details))
-        elif header:
-            rows.append(header)
-        elif details:
-            rows.append('\n'.join(details))
-    return '\n\n'.join(rows)
+EXPORT_COLUMNS = [
+    Profile.hm_id, Profile.name, Profile.competency, Profile.joining_date,
+    Profile.total_exp_years, Profile.total_exp_months, Profile.relevant_exp_years, Profile.relevant_exp_months,
+    Profile.reporting_location_type, Profile.customer_name, Profile.customer_address, Profile.office_city,
+    Profile.primary_role, Profile.industries, Profile.education, Profile.skills,
+    Profile.certifications, Profile.projects,
+    Profile.approved, Profile.approved_at, Profile.created_at, Profile.updated_at,
+]
+
+_export_pool = None
+_export_pool_lock = threading.Lock()
+
+def _get_export_pool():
+    global _export_pool
+    with _export_pool_lock:
+        if _export_pool is None:
+            # Workers only need profile_format; forkserver keeps them from
+            # inheriting this process's threads, locks and DB connections.
+            _export_pool = ProcessPoolExecutor(
+                max_workers=EXPORT_WORKERS,
+                mp_context=multiprocessing.get_context('forkserver'),
+            )
+        return _export_pool
+
+def _discard_export_pool(pool):
+    global _export_pool
+    with _export_pool_lock:
+        if _export_pool is pool:
+            _export_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def _iter_export_rows():
+    """Yield formatted export rows in id order.
+
+    Rows are fetched in chunks of EXPORT_BATCH_SIZE in a single scan. Chunks are
+    buffered until EXPORT_PARALLEL_MIN_ROWS rows have arrived. If the stream ends
+    first, or EXPORT_WORKERS is 1 or less, the rows are formatted serially in the
+    request worker. Otherwise each chunk goes to the process pool as soon as it is read,
+    with up to two chunks per worker in flight, and results are yielded in
+    submission order.
+    """
+    has_pic = db.func.coalesce(db.func.length(Profile.profile_pic), 0) > 0
+    query = (db.session.query(*EXPORT_COLUMNS, has_pic)
+             .order_by(Profile.id)
+             .yield_per(EXPORT_BATCH_SIZE))
+
+    def chunks():
+        chunk = []
+        for r in query:
+            chunk.append(tuple(r))
+            if len(chunk) >= EXPORT_BATCH_SIZE:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    stream = chunks()
+    buffered, buffered_rows = [], 0
+    if EXPORT_WORKERS > 1:
+        for chunk in stream:
+            buffered.append(chunk)
+            buffered_rows += len(chunk)
+            if buffered_rows >= EXPORT_PARALLEL_MIN_ROWS:
+                break
+    if EXPORT_WORKERS <= 1 or buffered_rows < EXPORT_PARALLEL_MIN_ROWS:
+        for chunk in buffered:
+            yield from _format_export_chunk(chunk)
+        for chunk in stream:
+            yield from _format_export_chunk(chunk)
+        return
+
+    pool = _get_export_pool()
+    pending = deque()
+    try:
+        for chunk in itertools.chain(buffered, stream):
+            pending.append(pool.submit(_format_export_chunk, chunk))
+            if len(pending) >= EXPORT_WORKERS * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed); replace the pool so the next export starts fresh.
+        _discard_export_pool(pool)
+        raise
+    finally:
+        for f in pending:
+            f.cancel()
 
 @app.route('/api/admin/export/csv', methods=['GET'])
 @token_required
 def export_csv():
-    profiles = Profile.query.all()
     output = io.StringIO()
     writer = csv.writer(output)
-    writer.writerow([
-        'HM ID','Name','Competency','Joining Date',
-        'Total Exp (Y)','Total Exp (M)','Relevant Exp (Y)','Relevant Exp (M)',
-        'Location Type','Customer Name','Customer Address','Office City',
-        'Primary Role','Industries',
-        'Education',
-        'Skills (Detailed)',
-        'Certifications (Detailed)',
-        'Projects (Detailed)',
-        'Has Profile Pic',
-        'Approved','Approved At','Created At','Updated At'
-    ])
-    for p in profiles:
-        industries = _safe_json_loads(p.industries, [])
-        education = _safe_json_loads(p.education, [])
-        skills = _safe_json_loads(p.skills, [])
-        certs = _safe_json_loads(p.certifications, [])
-        projects = _safe_json_loads(p.projects, [])
-
-        industries_str = _fmt_join(industries)
-        education_str = _fmt_education(education)
-        skills_str = _fmt_skills(skills)
-        certs_str = _fmt_certs(certs)
-        projects_str = _fmt_projects(projects)
-
-        writer.writerow([
-            p.hm_id, p.name, p.competency, p.joining_date,
-            p.total_exp_years, p.total_exp_months, p.relevant_exp_years, p.relevant_exp_months,
-            p.reporting_location_type, p.customer_name, p.customer_address, p.office_city,
-            p.primary_role, industries_str,
-            education_str,
-            skills_str,
-            certs_str,
-            projects_str,
-            bool(p.profile_pic),
-            bool(p.approved),
-            p.approved_at.isoformat() if p.approved_at else '',
-            p.created_at.isoformat() if p.created_at else '',
-            p.updated_at.isoformat() if p.updated_at else ''
-        ])
+    writer.writerow(EXPORT_HEADERS)
+    writer.writerows(_iter_export_rows())
     output.seek(0)
     return send_file(io.BytesIO(output.getvalue().encode()), mimetype='text/csv',
                      as_attachment=True, download_name='profiles.csv')
@@ -464,60 +908,21 @@ def export_csv():
 @app.route('/api/admin/export/excel', methods=['GET'])
 @token_required
 def export_excel():
-    profiles = Profile.query.all()
     wb = openpyxl.Workbook()
     ws = wb.active
     ws.title = 'Profiles'
 
-    headers = [
-        'HM ID','Name','Competency','Joining Date',
-        'Total Exp (Y)','Total Exp (M)','Relevant Exp (Y)','Relevant Exp (M)',
-        'Location Type','Customer Name','Customer Address','Office City',
-        'Primary Role','Industries',
-        'Education',
-        'Skills (Detailed)',
-        'Certifications (Detailed)',
-        'Projects (Detailed)',
-        'Has Profile Pic',
-        'Approved','Approved At','Created At','Updated At'
-    ]
     header_fill = PatternFill(start_color='1F6E3C', end_color='1F6E3C', fill_type='solid')
     header_font = Font(color='FFFFFF', bold=True)
     
-    for col, header in enumerate(headers, 1):
+    for col, header in enumerate(EXPORT_HEADERS, 1):
         cell = ws.cell(row=1, column=col, value=header)
         cell.fill = header_fill
         cell.font = header_font
         cell.alignment = Alignment(horizontal='center')
     
-    for p in profiles:
-        industries = _safe_json_loads(p.industries, [])
-        education = _safe_json_loads(p.education, [])
-        skills = _safe_json_loads(p.skills, [])
-        certs = _safe_json_loads(p.certifications, [])
-        projects = _safe_json_loads(p.projects, [])
-
-        industries_str = _fmt_join(industries)
-        education_str = _fmt_education(education)
-        skills_str = _fmt_skills(skills)
-        certs_str = _fmt_certs(certs)
-        projects_str = _fmt_projects(projects)
-
-        ws.append([
-            p.hm_id, p.name, p.competency, p.joining_date,
-            p.total_exp_years, p.total_exp_months, p.relevant_exp_years, p.relevant_exp_months,
-            p.reporting_location_type, p.customer_name, p.customer_address, p.office_city,
-            p.primary_role, industries_str,
-            education_str,
-            skills_str,
-            certs_str,
-            projects_str,
-            bool(p.profile_pic),
-            bool(p.approved),
-            p.approved_at.isoformat() if p.approved_at else '',
-            p.created_at.isoformat() if p.created_at else '',
-            p.updated_at.isoformat() if p.updated_at else ''
-        ])
+    for row in _iter_export_rows():
+        ws.append(row)
 
     for col in ws.columns:
         max_len = max(len(str(cell.value or '')) for cell in col)
@@ -529,6 +934,144 @@ def export_excel():
     return send_file(output, mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
                      as_attachment=True, download_name='profiles.xlsx')
 
+EDUCATION_KEYS = ['degree', 'specialisation', 'institution', 'year', 'grade']
+CERT_KEYS = ['name', 'provider', 'date', 'expiry']
+PROJECT_KEYS = ['title', 'role', 'duration', 'tools', 'description', 'responsibility', 'awards']
+
+def _str_or_none(val):
+    if val is None:
+        return None
+    s = str(val).strip()
+    return s or None
+
+def _struct_rows(items, keys):
+    rows = []
+    for it in items or []:
+        if isinstance(it, dict):
+            rows.append({k: _str_or_none(it.get(k)) for k in keys})
+    return rows
+
+def _parquet_schemas(pa):
+    label = pa.dictionary(pa.int32(), pa.string())
+    profiles = pa.schema([
+        ('id', pa.int64()), ('hm_id', pa.string()), ('name', pa.string()),
+        ('competency', label), ('joining_date', pa.string()),
+        ('total_exp_years', pa.int32()), ('total_exp_months', pa.int32()),
+        ('relevant_exp_years', pa.int32()), ('relevant_exp_months', pa.int32()),
+        ('reporting_location_type', label), ('customer_name', pa.string()),
+        ('customer_address', pa.string()), ('office_city', pa.string()),
+        ('primary_role', label), ('industries', pa.list_(pa.string())),
+        ('education', pa.list_(pa.struct([(k, pa.string()) for k in EDUCATION_KEYS]))),
+        ('certifications', pa.list_(pa.struct([(k, pa.string()) for k in CERT_KEYS]))),
+        ('projects', pa.list_(pa.struct([(k, pa.string()) for k in PROJECT_KEYS]))),
+        ('skill_count', pa.int32()), ('has_profile_pic', pa.bool_()), ('approved', pa.bool_()),
+        ('approved_at', pa.timestamp('us')), ('created_at', pa.timestamp('us')),
+        ('updated_at', pa.timestamp('us')),
+    ])
+    skills = pa.schema([
+        ('profile_id', pa.int64()), ('hm_id', pa.string()),
+        ('skill_id', pa.string()), ('skill_name', pa.string()),
+        ('platform_group', label), ('primary_secondary', label),
+        ('years_exp', pa.float64()), ('self_assessment', label),
+    ])
+    return profiles, skills
+
+@app.route('/api/admin/export/parquet', methods=['GET'])
+@token_required
+def export_parquet():
+    """Columnar export: a zip with profiles.parquet and skills.parquet.
+
+    Profiles are streamed from the DB in batches of EXPORT_BATCH_SIZE and each
+    batch is written as its own row group, so only one batch of Python rows is held
+    at a time. Both Parquet files and the zip are spooled to temporary files rather
+    than memory, and the zip is streamed from disk. Nested fields are kept as
+    list<struct> columns instead of being flattened to text, and skills get their
+    own table (one row per profile-skill) joinable on profile_id.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        return jsonify({'error': 'Parquet export requires pyarrow'}), 501
+
+    profile_schema, skill_schema = _parquet_schemas(pa)
+    profiles_buf = tempfile.TemporaryFile()
+    skills_buf = tempfile.TemporaryFile()
+    profile_writer = pq.ParquetWriter(profiles_buf, profile_schema, compression='zstd')
+    skill_writer = pq.ParquetWriter(skills_buf, skill_schema, compression='zstd')
+
+    # The base64 profile picture is by far the largest column and only its presence
+    # is exported, so don't pull it over the wire.
+    has_pic = db.func.coalesce(db.func.length(Profile.profile_pic), 0) > 0
+    query = (db.session.query(Profile, has_pic)
+             .options(db.defer(Profile.profile_pic))
+             .order_by(Profile.id)
+             .yield_per(EXPORT_BATCH_SIZE))
+
+    def flush(prows, srows):
+        if prows:
+            profile_writer.write_batch(pa.RecordBatch.from_pylist(prows, schema=profile_schema))
+        if srows:
+            skill_writer.write_batch(pa.RecordBatch.from_pylist(srows, schema=skill_schema))
+
+    prows, srows = [], []
+    try:
+        for p, pic in query:
+            skills = normalize_skills_list(_safe_json_loads(p.skills, []))
+            industries = _safe_json_loads(p.industries, [])
+            prows.append({
+                'id': p.id, 'hm_id': p.hm_id, 'name': p.name,
+                'competency': p.competency, 'joining_date': p.joining_date,
+                'total_exp_years': p.total_exp_years, 'total_exp_months': p.total_exp_months,
+                'relevant_exp_years': p.relevant_exp_years, 'relevant_exp_months': p.relevant_exp_months,
+                'reporting_location_type': p.reporting_location_type,
+                'customer_name': p.customer_name, 'customer_address': p.customer_address,
+                'office_city': p.office_city, 'primary_role': p.primary_role,
+                'industries': [v for v in map(_str_or_none, industries) if v] if isinstance(industries, list) else [],
+                'education': _struct_rows(_safe_json_loads(p.education, []), EDUCATION_KEYS),
+                'certifications': _struct_rows(_safe_json_loads(p.certifications, []), CERT_KEYS),
+                'projects': _struct_rows(_safe_json_loads(p.projects, []), PROJECT_KEYS),
+                'skill_count': len(skills), 'has_profile_pic': bool(pic),
+                'approved': bool(p.approved), 'approved_at': p.approved_at,
+                'created_at': p.created_at, 'updated_at': p.updated_at,
+            })
+            for s in skills:
+                srows.append({
+                    'profile_id': p.id, 'hm_id': p.hm_id,
+                    'skill_id': _str_or_none(s.get('skill_id')),
+                    'skill_name': _str_or_none(s.get('skill_name')),
+                    'platform_group': _str_or_none(s.get('platform_group')),
+                    'primary_secondary': _str_or_none(s.get('primary_secondary')),
+                    'years_exp': _to_float_or_none(s.get('years_exp')),
+                    'self_assessment': _str_or_none(s.get('self_assessment')),
+                })
+            if len(prows) >= EXPORT_BATCH_SIZE:
+                flush(prows, srows)
+                prows, srows = [], []
+        flush(prows, srows)
+    finally:
+        profile_writer.close()
+        skill_writer.close()
+
+    # Closed by send_file once the response has been streamed.
+    output = tempfile.TemporaryFile()
+    try:
+        # Parquet pages are already zstd-compressed; deflating them again only costs CPU.
+        with zipfile.ZipFile(output, 'w', compression=zipfile.ZIP_STORED) as zf:
+            for name, part in (('profiles.parquet', profiles_buf), ('skills.parquet', skills_buf)):
+                part.seek(0)
+                with zf.open(name, 'w', force_zip64=True) as dst:
+                    shutil.copyfileobj(part, dst)
+    except Exception:
+        output.close()
+        raise
+    finally:
+        profiles_buf.close()
+        skills_buf.close()
+    output.seek(0)
+    return send_file(output, mimetype='application/zip',
+                     as_attachment=True, download_name='profiles_parquet.zip')
+
 @app.route('/api/admin/stats', methods=['GET'])
 @token_required
 def stats():
@@ -541,6 +1084,50 @@ def stats():
         'by_competency': {comp: cnt for comp, cnt in competencies if comp}
     })
 
+@app.route('/api/admin/stats/timeseries', methods=['GET'])
+@token_required
+def stats_timeseries():
+    """Submission/update/approval trends, read from the rollup table only."""
+    interval = request.args.get('interval', 'day').strip().lower()
+    group_by = request.args.get('group_by', '').strip().lower()
+    if interval not in ('day', 'week'):
+        return jsonify({'error': 'interval must be day or week'}), 400
+    if group_by not in ('', 'competency', 'primary_role'):
+        return jsonify({'error': 'group_by must be competency or primary_role'}), 400
+    try:
+        start = datetime.strptime(request.args['start'], '%Y-%m-%d').date() if request.args.get('start') else None
+        end = datetime.strptime(request.args['end'], '%Y-%m-%d').date() if request.args.get('end') else None
+    except ValueError:
+        return jsonify({'error': 'start/end must be YYYY-MM-DD'}), 400
+
+    cols = [ProfileRollup.bucket_date]
+    if group_by:
+        cols.append(getattr(ProfileRollup, group_by))
+    query = db.session.query(*cols, *[db.func.sum(getattr(ProfileRollup, c)) for c in ROLLUP_COUNTS])
+    if start:
+        query = query.filter(ProfileRollup.bucket_date >= start)
+    if end:
+        query = query.filter(ProfileRollup.bucket_date <= end)
+    rows = query.group_by(*cols).all()
+
+    buckets = defaultdict(lambda: dict.fromkeys(ROLLUP_COUNTS, 0))
+    for row in rows:
+        day = row[0]
+        if interval == 'week':
+            day = day - timedelta(days=day.weekday())
+        key = (day, row[1] if group_by else None)
+        for c, v in zip(ROLLUP_COUNTS, row[-len(ROLLUP_COUNTS):]):
+            buckets[key][c] += int(v or 0)
+
+    series = []
+    for (day, group), c in sorted(buckets.items(), key=lambda kv: (kv[0][0], kv[0][1] or '')):
+        point = {'bucket': day.isoformat()}
+        if group_by:
+            point[group_by] = group or None
+        point.update(c)
+        series.append(point)
+    return jsonify({'interval': interval, 'group_by': group_by or None, 'series': series})
+
 # ─── Skills list ─────────────────────────────────────────────────────────────
 
 @app.route('/api/skills', methods=['GET'])
@@ -575,181 +1162,6 @@ def profile_to_dict(p):
         'created_at': p.created_at.isoformat(), 'updated_at': p.updated_at.isoformat()
     }
 
-SKILLS_MASTER = [
-    {"skill_id": "SK00001", "skill_name": "ANN", "platform_group": "AI-ML"},
-    {"skill_id": "SK00002", "skill_name": "CNN", "platform_group": "AI-ML"},
-    {"skill_id": "SK00003", "skill_name": "Computer Vision", "platform_group": "AI-ML"},
-    {"skill_id": "SK00004", "skill_name": "Deep Learning", "platform_group": "AI-ML"},
-    {"skill_id": "SK00005", "skill_name": "Keras", "platform_group": "AI-ML"},
-    {"skill_id": "SK00006", "skill_name": "LangChain", "platform_group": "AI-ML"},
-    {"skill_id": "SK00007", "skill_name": "LangGraph", "platform_group": "AI-ML"},
-    {"skill_id": "SK00008", "skill_name": "LightGBM", "platform_group": "AI-ML"},
-    {"skill_id": "SK00009", "skill_name": "MLflow", "platform_group": "AI-ML"},
-    {"skill_id": "SK00010", "skill_name": "Machine Learning", "platform_group": "AI-ML"},
-    {"skill_id": "SK00011", "skill_name": "Natural Language Processing", "platform_group": "AI-ML"},
-    {"skill_id": "SK00012", "skill_name": "PyTorch", "platform_group": "AI-ML"},
-    {"skill_id": "SK00013", "skill_name": "RAG", "platform_group": "AI-ML"},
-    {"skill_id": "SK00014", "skill_name": "Scikit-learn", "platform_group": "AI-ML"},
-    {"skill_id": "SK00015", "skill_name": "TensorFlow", "platform_group": "AI-ML"},
-    {"skill_id": "SK00016", "skill_name": "Time Series Forecasting", "platform_group": "AI-ML"},
-    {"skill_id": "SK00017", "skill_name": "XGBoost", "platform_group": "AI-ML"},
-    {"skill_id": "SK00018", "skill_name": "Hugging Face Transformers", "platform_group": "AI-ML"},
-    {"skill_id": "SK00019", "skill_name": "MLflow (Python)", "platform_group": "AI-ML"},
-    {"skill_id": "SK00020", "skill_name": "Prompt Engineering", "platform_group": "AI-ML"},
-    {"skill_id": "SK00021", "skill_name": "AWS Bedrock", "platform_group": "AWS"},
-    {"skill_id": "SK00022", "skill_name": "AWS CloudFormation", "platform_group": "AWS"},
-    {"skill_id": "SK00023", "skill_name": "AWS CloudWatch", "platform_group": "AWS"},
-    {"skill_id": "SK00024", "skill_name": "AWS Glue", "platform_group": "AWS"},
-    {"skill_id": "SK00025", "skill_name": "AWS IAM", "platform_group": "AWS"},
-    {"skill_id": "SK00026", "skill_name": "AWS Lambda", "platform_group": "AWS"},
-    {"skill_id": "SK00027", "skill_name": "AWS SageMaker", "platform_group": "AWS"},
-    {"skill_id": "SK00028", "skill_name": "Amazon Athena", "platform_group": "AWS"},
-    {"skill_id": "SK00029", "skill_name": "Amazon EC2", "platform_group": "AWS"},
-    {"skill_id": "SK00030", "skill_name": "Amazon EMR", "platform_group": "AWS"},
-    {"skill_id": "SK00031", "skill_name": "Amazon Redshift", "platform_group": "AWS"},
-    {"skill_id": "SK00032", "skill_name": "Amazon S3", "platform_group": "AWS"},
-    {"skill_id": "SK00033", "skill_name": "AWS KMS", "platform_group": "AWS"},
-    {"skill_id": "SK00034", "skill_name": "Amazon Kinesis", "platform_group": "AWS"},
-    {"skill_id": "SK00035", "skill_name": "Databricks (AWS)", "platform_group": "AWS"},
-    {"skill_id": "SK00036", "skill_name": "Azure Blob Storage", "platform_group": "Azure"},
-    {"skill_id": "SK00037", "skill_name": "Azure Data Factory", "platform_group": "Azure"},
-    {"skill_id": "SK00038", "skill_name": "Azure Data Lake Storage Gen2", "platform_group": "Azure"},
-    {"skill_id": "SK00039", "skill_name": "Azure Databricks", "platform_group": "Azure"},
-    {"skill_id": "SK00040", "skill_name": "Azure DevOps", "platform_group": "Azure"},
-    {"skill_id": "SK00041", "skill_name": "Azure Event Hub", "platform_group": "Azure"},
-    {"skill_id": "SK00042", "skill_name": "Azure Functions", "platform_group": "Azure"},
-    {"skill_id": "SK00043", "skill_name": "Azure Key Vault", "platform_group": "Azure"},
-    {"skill_id": "SK00044", "skill_name": "Azure Machine Learning", "platform_group": "Azure"},
-    {"skill_id": "SK00045", "skill_name": "Azure OpenAI", "platform_group": "Azure"},
-    {"skill_id": "SK00046", "skill_name": "Azure Synapse Analytics", "platform_group": "Azure"},
-    {"skill_id": "SK00047", "skill_name": "Business requirement analysis", "platform_group": "Base"},
-    {"skill_id": "SK00048", "skill_name": "Data Science", "platform_group": "Base"},
-    {"skill_id": "SK00049", "skill_name": "FastAPI", "platform_group": "Base"},
-    {"skill_id": "SK00050", "skill_name": "Flask", "platform_group": "Base"},
-    {"skill_id": "SK00051", "skill_name": "Google BigQuery", "platform_group": "Base"},
-    {"skill_id": "SK00052", "skill_name": "Java", "platform_group": "Base"},
-    {"skill_id": "SK00053", "skill_name": "JavaScript", "platform_group": "Base"},
-    {"skill_id": "SK00054", "skill_name": "Microsoft Fabric", "platform_group": "Base"},
-    {"skill_id": "SK00055", "skill_name": "PySpark", "platform_group": "Base"},
-    {"skill_id": "SK00056", "skill_name": "Python", "platform_group": "Base"},
-    {"skill_id": "SK00057", "skill_name": "R", "platform_group": "Base"},
-    {"skill_id": "SK00058", "skill_name": "Scala", "platform_group": "Base"},
-    {"skill_id": "SK00059", "skill_name": "Snowflake", "platform_group": "Base"},
-    {"skill_id": "SK00060", "skill_name": "Async Programming (asyncio)", "platform_group": "Base"},
-    {"skill_id": "SK00061", "skill_name": "Auto Loader", "platform_group": "Base"},
-    {"skill_id": "SK00062", "skill_name": "Bash", "platform_group": "Base"},
-    {"skill_id": "SK00063", "skill_name": "C++", "platform_group": "Base"},
-    {"skill_id": "SK00064", "skill_name": "Cassandra", "platform_group": "Base"},
-    {"skill_id": "SK00065", "skill_name": "Data Vault Modeling", "platform_group": "Base"},
-    {"skill_id": "SK00066", "skill_name": "Dimensional Modeling", "platform_group": "Base"},
-    {"skill_id": "SK00067", "skill_name": "Dockerizing Python Apps", "platform_group": "Base"},
-    {"skill_id": "SK00068", "skill_name": "DynamoDB", "platform_group": "Base"},
-    {"skill_id": "SK00069", "skill_name": "IBM DB2", "platform_group": "Base"},
-    {"skill_id": "SK00070", "skill_name": "Informatica PowerCenter", "platform_group": "Base"},
-    {"skill_id": "SK00071", "skill_name": "LangChain (Python)", "platform_group": "Base"},
-    {"skill_id": "SK00072", "skill_name": "MongoDB", "platform_group": "Base"},
-    {"skill_id": "SK00073", "skill_name": "Neo4j", "platform_group": "Base"},
-    {"skill_id": "SK00074", "skill_name": "NumPy", "platform_group": "Base"},
-    {"skill_id": "SK00075", "skill_name": "OOP in Python", "platform_group": "Base"},
-    {"skill_id": "SK00076", "skill_name": "Oracle", "platform_group": "Base"},
-    {"skill_id": "SK00077", "skill_name": "Pandas", "platform_group": "Base"},
-    {"skill_id": "SK00078", "skill_name": "Pentaho PDI", "platform_group": "Base"},
-    {"skill_id": "SK00079", "skill_name": "PowerShell", "platform_group": "Base"},
-    {"skill_id": "SK00080", "skill_name": "PyTest", "platform_group": "Base"},
-    {"skill_id": "SK00081", "skill_name": "Query Optimization", "platform_group": "Base"},
-    {"skill_id": "SK00082", "skill_name": "Redis", "platform_group": "Base"},
-    {"skill_id": "SK00083", "skill_name": "Stored Procedures", "platform_group": "Base"},
-    {"skill_id": "SK00084", "skill_name": "Talend", "platform_group": "Base"},
-    {"skill_id": "SK00085", "skill_name": "Teradata", "platform_group": "Base"},
-    {"skill_id": "SK00086", "skill_name": "Window Functions", "platform_group": "Base"},
-    {"skill_id": "SK00087", "skill_name": "DBT", "platform_group": "Base"},
-    {"skill_id": "SK00088", "skill_name": "Power BI", "platform_group": "BI"},
-    {"skill_id": "SK00089", "skill_name": "QuickSight", "platform_group": "BI"},
-    {"skill_id": "SK00090", "skill_name": "SSAS", "platform_group": "BI"},
-    {"skill_id": "SK00091", "skill_name": "SSIS", "platform_group": "BI"},
-    {"skill_id": "SK00092", "skill_name": "SSRS", "platform_group": "BI"},
-    {"skill_id": "SK00093", "skill_name": "Tableau", "platform_group": "BI"},
-    {"skill_id": "SK00094", "skill_name": "DAX", "platform_group": "BI"},
-    {"skill_id": "SK00095", "skill_name": "Apache NiFi", "platform_group": "BigData"},
-    {"skill_id": "SK00096", "skill_name": "Hadoop", "platform_group": "BigData"},
-    {"skill_id": "SK00097", "skill_name": "Hive", "platform_group": "BigData"},
-    {"skill_id": "SK00098", "skill_name": "Kafka", "platform_group": "BigData"},
-    {"skill_id": "SK00099", "skill_name": "Kafka Streams", "platform_group": "BigData"},
-    {"skill_id": "SK00100", "skill_name": "Spark", "platform_group": "BigData"},
-    {"skill_id": "SK00101", "skill_name": "Airflow", "platform_group": "BigData"},
-    {"skill_id": "SK00102", "skill_name": "Apache Iceberg", "platform_group": "BigData"},
-    {"skill_id": "SK00103", "skill_name": "Apache Kafka", "platform_group": "BigData"},
-    {"skill_id": "SK00104", "skill_name": "Apache Spark", "platform_group": "BigData"},
-    {"skill_id": "SK00105", "skill_name": "Dask", "platform_group": "BigData"},
-    {"skill_id": "SK00106", "skill_name": "Structured Streaming", "platform_group": "BigData"},
-    {"skill_id": "SK00107", "skill_name": "Databricks", "platform_group": "Databricks"},
-    {"skill_id": "SK00108", "skill_name": "Delta Lake", "platform_group": "Databricks"},
-    {"skill_id": "SK00109", "skill_name": "Delta Live Tables", "platform_group": "Databricks"},
-    {"skill_id": "SK00110", "skill_name": "Unity Catalog", "platform_group": "Databricks"},
-    {"skill_id": "SK00111", "skill_name": "Databricks (GCP)", "platform_group": "Databricks"},
-    {"skill_id": "SK00112", "skill_name": "Databricks CLI", "platform_group": "Databricks"},
-    {"skill_id": "SK00113", "skill_name": "Databricks Feature Store", "platform_group": "Databricks"},
-    {"skill_id": "SK00114", "skill_name": "Databricks REST API", "platform_group": "Databricks"},
-    {"skill_id": "SK00115", "skill_name": "Databricks Runtime", "platform_group": "Databricks"},
-    {"skill_id": "SK00116", "skill_name": "Databricks Runtime for ML", "platform_group": "Databricks"},
-    {"skill_id": "SK00117", "skill_name": "Databricks SQL", "platform_group": "Databricks"},
-    {"skill_id": "SK00118", "skill_name": "Databricks SQL Warehouse", "platform_group": "Databricks"},
-    {"skill_id": "SK00119", "skill_name": "Mosaic AI", "platform_group": "Databricks"},
-    {"skill_id": "SK00120", "skill_name": "Docker", "platform_group": "DevOps"},
-    {"skill_id": "SK00121", "skill_name": "Git", "platform_group": "DevOps"},
-    {"skill_id": "SK00122", "skill_name": "Jenkins", "platform_group": "DevOps"},
-    {"skill_id": "SK00123", "skill_name": "Kubernetes", "platform_group": "DevOps"},
-    {"skill_id": "SK00124", "skill_name": "Terraform", "platform_group": "DevOps"},
-    {"skill_id": "SK00125", "skill_name": "Autosys", "platform_group": "DevOps"},
-    {"skill_id": "SK00126", "skill_name": "Cloud Composer", "platform_group": "DevOps"},
-    {"skill_id": "SK00127", "skill_name": "Control-M", "platform_group": "DevOps"},
-    {"skill_id": "SK00128", "skill_name": "Banking Analytics", "platform_group": "Domain"},
-    {"skill_id": "SK00129", "skill_name": "Bioinformatics", "platform_group": "Domain"},
-    {"skill_id": "SK00130", "skill_name": "Data Analytics", "platform_group": "Domain"},
-    {"skill_id": "SK00131", "skill_name": "Gene Annotation", "platform_group": "Domain"},
-    {"skill_id": "SK00132", "skill_name": "Healthcare AI", "platform_group": "Domain"},
-    {"skill_id": "SK00133", "skill_name": "Human and Bacterial Genomics", "platform_group": "Domain"},
-    {"skill_id": "SK00134", "skill_name": "Industrial IoT", "platform_group": "Domain"},
-    {"skill_id": "SK00135", "skill_name": "Marketing Analytics", "platform_group": "Domain"},
-    {"skill_id": "SK00136", "skill_name": "Metagenomics", "platform_group": "Domain"},
-    {"skill_id": "SK00137", "skill_name": "Protein Structure Modelling", "platform_group": "Domain"},
-    {"skill_id": "SK00138", "skill_name": "Single Cell Omics", "platform_group": "Domain"},
-    {"skill_id": "SK00139", "skill_name": "Vibration Analytics", "platform_group": "Domain"},
-    {"skill_id": "SK00140", "skill_name": "Business Intelligence", "platform_group": "Functional"},
-    {"skill_id": "SK00141", "skill_name": "Capacity Planning", "platform_group": "Functional"},
-    {"skill_id": "SK00142", "skill_name": "Data Architecture", "platform_group": "Functional"},
-    {"skill_id": "SK00143", "skill_name": "Data Engineering", "platform_group": "Functional"},
-    {"skill_id": "SK00144", "skill_name": "Data Governance", "platform_group": "Functional"},
-    {"skill_id": "SK00145", "skill_name": "Data Migration", "platform_group": "Functional"},
-    {"skill_id": "SK00146", "skill_name": "Data Modernization", "platform_group": "Functional"},
-    {"skill_id": "SK00147", "skill_name": "Designing scalable architecture", "platform_group": "Functional"},
-    {"skill_id": "SK00148", "skill_name": "End-to-end analytics solution designing", "platform_group": "Functional"},
-    {"skill_id": "SK00149", "skill_name": "Performance Optimization", "platform_group": "Functional"},
-    {"skill_id": "SK00150", "skill_name": "Root Cause Analysis", "platform_group": "Functional"},
-    {"skill_id": "SK00151", "skill_name": "Agile", "platform_group": "Soft"},
-    {"skill_id": "SK00152", "skill_name": "Consulting", "platform_group": "Soft"},
-    {"skill_id": "SK00153", "skill_name": "Insight generation", "platform_group": "Soft"},
-    {"skill_id": "SK00154", "skill_name": "Pre-Sales", "platform_group": "Soft"},
-    {"skill_id": "SK00155", "skill_name": "Product Management", "platform_group": "Soft"},
-    {"skill_id": "SK00156", "skill_name": "Requirement gathering", "platform_group": "Soft"},
-    {"skill_id": "SK00157", "skill_name": "Research manuscript writing", "platform_group": "Soft"},
-    {"skill_id": "SK00158", "skill_name": "Scrum planning", "platform_group": "Soft"},
-    {"skill_id": "SK00159", "skill_name": "Sprint planning", "platform_group": "Soft"},
-    {"skill_id": "SK00160", "skill_name": "Stakeholder management", "platform_group": "Soft"},
-    {"skill_id": "SK00161", "skill_name": "Team management", "platform_group": "Soft"},
-    {"skill_id": "SK00162", "skill_name": "PL/SQL", "platform_group": "SQL"},
-    {"skill_id": "SK00163", "skill_name": "SQL", "platform_group": "SQL"},
-    {"skill_id": "SK00164", "skill_name": "Spark SQL", "platform_group": "SQL"},
-    {"skill_id": "SK00165", "skill_name": "T-SQL", "platform_group": "SQL"},
-    {"skill_id": "SK00166", "skill_name": "ANSI SQL", "platform_group": "SQL"},
-    {"skill_id": "SK00167", "skill_name": "BigQuery SQL", "platform_group": "SQL"},
-    {"skill_id": "SK00168", "skill_name": "MySQL", "platform_group": "SQL"},
-    {"skill_id": "SK00169", "skill_name": "PostgreSQL", "platform_group": "SQL"},
-    {"skill_id": "SK00170", "skill_name": "Redshift SQL", "platform_group": "SQL"},
-    {"skill_id": "SK00171", "skill_name": "SQL Server", "platform_group": "SQL"},
-    {"skill_id": "SK00172", "skill_name": "Snowflake SQL", "platform_group": "SQL"},
-]
-
 # ─── Init ─────────────────────────────────────────────────────────────────────
 
 def create_default_admin():
@@ -765,6 +1177,17 @@ def create_default_admin():
                     db.session.execute(text("ALTER TABLE profile ADD COLUMN approved BOOLEAN DEFAULT 0"))
                 if 'approved_at' not in cols:
                     db.session.execute(text("ALTER TABLE profile ADD COLUMN approved_at DATETIME"))
+                if 'content_hash' not in cols:
+                    db.session.execute(text("ALTER TABLE profile ADD COLUMN content_hash VARCHAR(64)"))
+                if 'approved_competency' not in cols:
+                    db.session.execute(text("ALTER TABLE profile ADD COLUMN approved_competency VARCHAR(20)"))
+                    db.session.execute(text("ALTER TABLE profile ADD COLUMN approved_primary_role VARCHAR(100)"))
+                    # Best guess for approvals made before the bucket was recorded
+                    db.session.execute(text("""
+                        UPDATE profile SET approved_competency = COALESCE(competency, ''),
+                                           approved_primary_role = COALESCE(primary_role, '')
+                        WHERE approved_at IS NOT NULL
+                    """))
                 db.session.commit()
             elif uri.startswith('postgres'):
                 cols = [r[0] for r in db.session.execute(text("""
@@ -776,10 +1199,25 @@ def create_default_admin():
                     db.session.execute(text("ALTER TABLE profile ADD COLUMN approved BOOLEAN DEFAULT FALSE"))
                 if 'approved_at' not in cols:
                     db.session.execute(text("ALTER TABLE profile ADD COLUMN approved_at TIMESTAMP"))
+                if 'content_hash' not in cols:
+                    db.session.execute(text("ALTER TABLE profile ADD COLUMN content_hash VARCHAR(64)"))
+                if 'approved_competency' not in cols:
+                    db.session.execute(text("ALTER TABLE profile ADD COLUMN approved_competency VARCHAR(20)"))
+                    db.session.execute(text("ALTER TABLE profile ADD COLUMN approved_primary_role VARCHAR(100)"))
+                    # Best guess for approvals made before the bucket was recorded
+                    db.session.execute(text("""
+                        UPDATE profile SET approved_competency = COALESCE(competency, ''),
+                                           approved_primary_role = COALESCE(primary_role, '')
+                        WHERE approved_at IS NOT NULL
+                    """))
                 db.session.commit()
         except Exception:
             db.session.rollback()
 
+        # Seed trend rollups for databases that predate them.
+        if not ProfileRollup.query.first() and Profile.query.first():
+            backfill_profile_rollups()
+
         if not AdminUser.query.filter_by(username='admin').first():
             admin_password = os.environ.get('ADMIN_PASSWORD', 'admin123')
             hashed = bcrypt.generate_password_hash(admin_password).decode('utf-8')
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Concurrency benchmark for the database engine settings.
+
+Runs the same mixed workload (profile submissions plus admin list reads from
+concurrent processes) twice against a fresh database: once with
+DB_ENGINE_TUNING=0 (SQLAlchemy/driver defaults) and once with the tuned engine
+(WAL, synchronous=NORMAL, busy_timeout, mmap on SQLite; pooled, pre-pinged
+connections on Postgres). Reports throughput and failed requests per mode.
+
+    python bench_db.py --writers 8 --readers 8 --seconds 10
+
+Uses a throwaway SQLite file unless DATABASE_URL is set. Against Postgres,
+point DATABASE_URL at a scratch database: rows are written to it.
+"""
+import argparse
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def _worker(args):
+    os.environ['SKIP_DB_INIT'] = '1'
+    from app import app, db, create_default_admin
+    from sqlalchemy import text
+
+    create_default_admin()
+    with app.app_context():
+        journal = None
+        if db.engine.dialect.name == 'sqlite':
+            journal = db.session.execute(text('PRAGMA journal_mode')).scalar()
+    client = app.test_client()
+    token = client.post('/api/admin/login', json={
+        'username': 'admin', 'password': os.environ.get('ADMIN_PASSWORD', 'admin123'),
+    }).json['token']
+    auth = {'Authorization': f'Bearer {token}'}
+
+    tag = os.environ['BENCH_TAG']
+    results = multiprocessing.get_context('fork').Queue()
+
+    def run(kind, n, stop):
+        # Each client is its own process, like a gunicorn worker; don't share
+        # the parent's pooled connections across the fork.
+        with app.app_context():
+            db.engine.dispose(close=False)
+        c = app.test_client()
+        ok = failed = i = 0
+        while time.perf_counter() < stop:
+            if kind == 'writes':
+                # Alternate inserts with updates of this writer's earlier rows.
+                hm_id = f'BENCH-{tag}-{n}-{i // 2 if i % 2 else i}'
+                r = c.post('/api/profile', json={
+                    'hm_id': hm_id, 'name': f'Bench {i}', 'competency': 'C3',
+                    'primary_role': 'Data Engineer', 'skills': ['Python', 'SQL'],
+                    'projects': [{'title': 'P', 'description': 'x' * 400, 'tools': str(i)}],
+                })
+                good = r.status_code in (200, 201)
+            else:
+                r = c.get('/api/admin/profiles?per_page=20', headers=auth)
+                good = r.status_code == 200
+            ok += good
+            failed += not good
+            i += 1
+        results.put((kind, ok, failed))
+
+    start = time.perf_counter()
+    stop = start + args.seconds
+    ctx = multiprocessing.get_context('fork')
+    procs = [ctx.Process(target=run, args=('writes', n, stop)) for n in range(args.writers)]
+    procs += [ctx.Process(target=run, args=('reads', n, stop)) for n in range(args.readers)]
+    for p in procs:
+        p.start()
+    counts = {'writes': 0, 'reads': 0, 'errors': 0}
+    for _ in procs:
+        kind, ok, failed = results.get()
+        counts[kind] += ok
+        counts['errors'] += failed
+    for p in procs:
+        p.join()
+    elapsed = time.perf_counter() - start
+
+    label = 'tuned' if os.environ.get('DB_ENGINE_TUNING') != '0' else 'defaults'
+    mode = f' journal={journal}' if journal else ''
+    print(f"{label:>8}:{mode}  {counts['writes'] / elapsed:7.1f} writes/s  "
+          f"{counts['reads'] / elapsed:7.1f} reads/s  {counts['errors']} failed")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--writers', type=int, default=8)
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        _worker(args)
+        return
+
+    tmpdir = tempfile.mkdtemp(prefix='hm-bench-')
+    for tuning in ('0', '1'):
+        env = dict(os.environ, DB_ENGINE_TUNING=tuning, BENCH_TAG=f't{tuning}-{int(time.time())}')
+        if not os.environ.get('DATABASE_URL'):
+            # Fresh file per mode: WAL mode persists in the database file.
+            env['DATABASE_URL'] = 'sqlite:///' + os.path.join(tmpdir, f'bench-{tuning}.db')
+        subprocess.run([sys.executable, os.path.abspath(__file__), '--worker',
+                        '--writers', str(args.writers), '--readers', str(args.readers),
+                        '--seconds', str(args.seconds)],
+                       env=env, cwd=os.path.dirname(os.path.abspath(__file__)), check=True)
+
+
+if __name__ == '__main__':
+    main()
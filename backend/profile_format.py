@@ -0,0 +1,374 @@
+"""Skills master list and the pure helpers that format profile data.
+
+Kept free of Flask/DB setup so export worker processes can import it cheaply.
+"""
+import json
+
+SKILLS_MASTER = [
+    {"skill_id": "SK00001", "skill_name": "ANN", "platform_group": "AI-ML"},
+    {"skill_id": "SK00002", "skill_name": "CNN", "platform_group": "AI-ML"},
+    {"skill_id": "SK00003", "skill_name": "Computer Vision", "platform_group": "AI-ML"},
+    {"skill_id": "SK00004", "skill_name": "Deep Learning", "platform_group": "AI-ML"},
+    {"skill_id": "SK00005", "skill_name": "Keras", "platform_group": "AI-ML"},
+    {"skill_id": "SK00006", "skill_name": "LangChain", "platform_group": "AI-ML"},
+    {"skill_id": "SK00007", "skill_name": "LangGraph", "platform_group": "AI-ML"},
+    {"skill_id": "SK00008", "skill_name": "LightGBM", "platform_group": "AI-ML"},
+    {"skill_id": "SK00009", "skill_name": "MLflow", "platform_group": "AI-ML"},
+    {"skill_id": "SK00010", "skill_name": "Machine Learning", "platform_group": "AI-ML"},
+    {"skill_id": "SK00011", "skill_name": "Natural Language Processing", "platform_group": "AI-ML"},
+    {"skill_id": "SK00012", "skill_name": "PyTorch", "platform_group": "AI-ML"},
+    {"skill_id": "SK00013", "skill_name": "RAG", "platform_group": "AI-ML"},
+    {"skill_id": "SK00014", "skill_name": "Scikit-learn", "platform_group": "AI-ML"},
+    {"skill_id": "SK00015", "skill_name": "TensorFlow", "platform_group": "AI-ML"},
+    {"skill_id": "SK00016", "skill_name": "Time Series Forecasting", "platform_group": "AI-ML"},
+    {"skill_id": "SK00017", "skill_name": "XGBoost", "platform_group": "AI-ML"},
+    {"skill_id": "SK00018", "skill_name": "Hugging Face Transformers", "platform_group": "AI-ML"},
+    {"skill_id": "SK00019", "skill_name": "MLflow (Python)", "platform_group": "AI-ML"},
+    {"skill_id": "SK00020", "skill_name": "Prompt Engineering", "platform_group": "AI-ML"},
+    {"skill_id": "SK00021", "skill_name": "AWS Bedrock", "platform_group": "AWS"},
+    {"skill_id": "SK00022", "skill_name": "AWS CloudFormation", "platform_group": "AWS"},
+    {"skill_id": "SK00023", "skill_name": "AWS CloudWatch", "platform_group": "AWS"},
+    {"skill_id": "SK00024", "skill_name": "AWS Glue", "platform_group": "AWS"},
+    {"skill_id": "SK00025", "skill_name": "AWS IAM", "platform_group": "AWS"},
+    {"skill_id": "SK00026", "skill_name": "AWS Lambda", "platform_group": "AWS"},
+    {"skill_id": "SK00027", "skill_name": "AWS SageMaker", "platform_group": "AWS"},
+    {"skill_id": "SK00028", "skill_name": "Amazon Athena", "platform_group": "AWS"},
+    {"skill_id": "SK00029", "skill_name": "Amazon EC2", "platform_group": "AWS"},
+    {"skill_id": "SK00030", "skill_name": "Amazon EMR", "platform_group": "AWS"},
+    {"skill_id": "SK00031", "skill_name": "Amazon Redshift", "platform_group": "AWS"},
+    {"skill_id": "SK00032", "skill_name": "Amazon S3", "platform_group": "AWS"},
+    {"skill_id": "SK00033", "skill_name": "AWS KMS", "platform_group": "AWS"},
+    {"skill_id": "SK00034", "skill_name": "Amazon Kinesis", "platform_group": "AWS"},
+    {"skill_id": "SK00035", "skill_name": "Databricks (AWS)", "platform_group": "AWS"},
+    {"skill_id": "SK00036", "skill_name": "Azure Blob Storage", "platform_group": "Azure"},
+    {"skill_id": "SK00037", "skill_name": "Azure Data Factory", "platform_group": "Azure"},
+    {"skill_id": "SK00038", "skill_name": "Azure Data Lake Storage Gen2", "platform_group": "Azure"},
+    {"skill_id": "SK00039", "skill_name": "Azure Databricks", "platform_group": "Azure"},
+    {"skill_id": "SK00040", "skill_name": "Azure DevOps", "platform_group": "Azure"},
+    {"skill_id": "SK00041", "skill_name": "Azure Event Hub", "platform_group": "Azure"},
+    {"skill_id": "SK00042", "skill_name": "Azure Functions", "platform_group": "Azure"},
+    {"skill_id": "SK00043", "skill_name": "Azure Key Vault", "platform_group": "Azure"},
+    {"skill_id": "SK00044", "skill_name": "Azure Machine Learning", "platform_group": "Azure"},
+    {"skill_id": "SK00045", "skill_name": "Azure OpenAI", "platform_group": "Azure"},
+    {"skill_id": "SK00046", "skill_name": "Azure Synapse Analytics", "platform_group": "Azure"},
+    {"skill_id": "SK00047", "skill_name": "Business requirement analysis", "platform_group": "Base"},
+    {"skill_id": "SK00048", "skill_name": "Data Science", "platform_group": "Base"},
+    {"skill_id": "SK00049", "skill_name": "FastAPI", "platform_group": "Base"},
+    {"skill_id": "SK00050", "skill_name": "Flask", "platform_group": "Base"},
+    {"skill_id": "SK00051", "skill_name": "Google BigQuery", "platform_group": "Base"},
+    {"skill_id": "SK00052", "skill_name": "Java", "platform_group": "Base"},
+    {"skill_id": "SK00053", "skill_name": "JavaScript", "platform_group": "Base"},
+    {"skill_id": "SK00054", "skill_name": "Microsoft Fabric", "platform_group": "Base"},
+    {"skill_id": "SK00055", "skill_name": "PySpark", "platform_group": "Base"},
+    {"skill_id": "SK00056", "skill_name": "Python", "platform_group": "Base"},
+    {"skill_id": "SK00057", "skill_name": "R", "platform_group": "Base"},
+    {"skill_id": "SK00058", "skill_name": "Scala", "platform_group": "Base"},
+    {"skill_id": "SK00059", "skill_name": "Snowflake", "platform_group": "Base"},
+    {"skill_id": "SK00060", "skill_name": "Async Programming (asyncio)", "platform_group": "Base"},
+    {"skill_id": "SK00061", "skill_name": "Auto Loader", "platform_group": "Base"},
+    {"skill_id": "SK00062", "skill_name": "Bash", "platform_group": "Base"},
+    {"skill_id": "SK00063", "skill_name": "C++", "platform_group": "Base"},
+    {"skill_id": "SK00064", "skill_name": "Cassandra", "platform_group": "Base"},
+    {"skill_id": "SK00065", "skill_name": "Data Vault Modeling", "platform_group": "Base"},
+    {"skill_id": "SK00066", "skill_name": "Dimensional Modeling", "platform_group": "Base"},
+    {"skill_id": "SK00067", "skill_name": "Dockerizing Python Apps", "platform_group": "Base"},
+    {"skill_id": "SK00068", "skill_name": "DynamoDB", "platform_group": "Base"},
+    {"skill_id": "SK00069", "skill_name": "IBM DB2", "platform_group": "Base"},
+    {"skill_id": "SK00070", "skill_name": "Informatica PowerCenter", "platform_group": "Base"},
+    {"skill_id": "SK00071", "skill_name": "LangChain (Python)", "platform_group": "Base"},
+    {"skill_id": "SK00072", "skill_name": "MongoDB", "platform_group": "Base"},
+    {"skill_id": "SK00073", "skill_name": "Neo4j", "platform_group": "Base"},
+    {"skill_id": "SK00074", "skill_name": "NumPy", "platform_group": "Base"},
+    {"skill_id": "SK00075", "skill_name": "OOP in Python", "platform_group": "Base"},
+    {"skill_id": "SK00076", "skill_name": "Oracle", "platform_group": "Base"},
+    {"skill_id": "SK00077", "skill_name": "Pandas", "platform_group": "Base"},
+    {"skill_id": "SK00078", "skill_name": "Pentaho PDI", "platform_group": "Base"},
+    {"skill_id": "SK00079", "skill_name": "PowerShell", "platform_group": "Base"},
+    {"skill_id": "SK00080", "skill_name": "PyTest", "platform_group": "Base"},
+    {"skill_id": "SK00081", "skill_name": "Query Optimization", "platform_group": "Base"},
+    {"skill_id": "SK00082", "skill_name": "Redis", "platform_group": "Base"},
+    {"skill_id": "SK00083", "skill_name": "Stored Procedures", "platform_group": "Base"},
+    {"skill_id": "SK00084", "skill_name": "Talend", "platform_group": "Base"},
+    {"skill_id": "SK00085", "skill_name": "Teradata", "platform_group": "Base"},
+    {"skill_id": "SK00086", "skill_name": "Window Functions", "platform_group": "Base"},
+    {"skill_id": "SK00087", "skill_name": "DBT", "platform_group": "Base"},
+    {"skill_id": "SK00088", "skill_name": "Power BI", "platform_group": "BI"},
+    {"skill_id": "SK00089", "skill_name": "QuickSight", "platform_group": "BI"},
+    {"skill_id": "SK00090", "skill_name": "SSAS", "platform_group": "BI"},
+    {"skill_id": "SK00091", "skill_name": "SSIS", "platform_group": "BI"},
+    {"skill_id": "SK00092", "skill_name": "SSRS", "platform_group": "BI"},
+    {"skill_id": "SK00093", "skill_name": "Tableau", "platform_group": "BI"},
+    {"skill_id": "SK00094", "skill_name": "DAX", "platform_group": "BI"},
+    {"skill_id": "SK00095", "skill_name": "Apache NiFi", "platform_group": "BigData"},
+    {"skill_id": "SK00096", "skill_name": "Hadoop", "platform_group": "BigData"},
+    {"skill_id": "SK00097", "skill_name": "Hive", "platform_group": "BigData"},
+    {"skill_id": "SK00098", "skill_name": "Kafka", "platform_group": "BigData"},
+    {"skill_id": "SK00099", "skill_name": "Kafka Streams", "platform_group": "BigData"},
+    {"skill_id": "SK00100", "skill_name": "Spark", "platform_group": "BigData"},
+    {"skill_id": "SK00101", "skill_name": "Airflow", "platform_group": "BigData"},
+    {"skill_id": "SK00102", "skill_name": "Apache Iceberg", "platform_group": "BigData"},
+    {"skill_id": "SK00103", "skill_name": "Apache Kafka", "platform_group": "BigData"},
+    {"skill_id": "SK00104", "skill_name": "Apache Spark", "platform_group": "BigData"},
+    {"skill_id": "SK00105", "skill_name": "Dask", "platform_group": "BigData"},
+    {"skill_id": "SK00106", "skill_name": "Structured Streaming", "platform_group": "BigData"},
+    {"skill_id": "SK00107", "skill_name": "Databricks", "platform_group": "Databricks"},
+    {"skill_id": "SK00108", "skill_name": "Delta Lake", "platform_group": "Databricks"},
+    {"skill_id": "SK00109", "skill_name": "Delta Live Tables", "platform_group": "Databricks"},
+    {"skill_id": "SK00110", "skill_name": "Unity Catalog", "platform_group": "Databricks"},
+    {"skill_id": "SK00111", "skill_name": "Databricks (GCP)", "platform_group": "Databricks"},
+    {"skill_id": "SK00112", "skill_name": "Databricks CLI", "platform_group": "Databricks"},
+    {"skill_id": "SK00113", "skill_name": "Databricks Feature Store", "platform_group": "Databricks"},
+    {"skill_id": "SK00114", "skill_name": "Databricks REST API", "platform_group": "Databricks"},
+    {"skill_id": "SK00115", "skill_name": "Databricks Runtime", "platform_group": "Databricks"},
+    {"skill_id": "SK00116", "skill_name": "Databricks Runtime for ML", "platform_group": "Databricks"},
+    {"skill_id": "SK00117", "skill_name": "Databricks SQL", "platform_group": "Databricks"},
+    {"skill_id": "SK00118", "skill_name": "Databricks SQL Warehouse", "platform_group": "Databricks"},
+    {"skill_id": "SK00119", "skill_name": "Mosaic AI", "platform_group": "Databricks"},
+    {"skill_id": "SK00120", "skill_name": "Docker", "platform_group": "DevOps"},
+    {"skill_id": "SK00121", "skill_name": "Git", "platform_group": "DevOps"},
+    {"skill_id": "SK00122", "skill_name": "Jenkins", "platform_group": "DevOps"},
+    {"skill_id": "SK00123", "skill_name": "Kubernetes", "platform_group": "DevOps"},
+    {"skill_id": "SK00124", "skill_name": "Terraform", "platform_group": "DevOps"},
+    {"skill_id": "SK00125", "skill_name": "Autosys", "platform_group": "DevOps"},
+    {"skill_id": "SK00126", "skill_name": "Cloud Composer", "platform_group": "DevOps"},
+    {"skill_id": "SK00127", "skill_name": "Control-M", "platform_group": "DevOps"},
+    {"skill_id": "SK00128", "skill_name": "Banking Analytics", "platform_group": "Domain"},
+    {"skill_id": "SK00129", "skill_name": "Bioinformatics", "platform_group": "Domain"},
+    {"skill_id": "SK00130", "skill_name": "Data Analytics", "platform_group": "Domain"},
+    {"skill_id": "SK00131", "skill_name": "Gene Annotation", "platform_group": "Domain"},
+    {"skill_id": "SK00132", "skill_name": "Healthcare AI", "platform_group": "Domain"},
+    {"skill_id": "SK00133", "skill_name": "Human and Bacterial Genomics", "platform_group": "Domain"},
+    {"skill_id": "SK00134", "skill_name": "Industrial IoT", "platform_group": "Domain"},
+    {"skill_id": "SK00135", "skill_name": "Marketing Analytics", "platform_group": "Domain"},
+    {"skill_id": "SK00136", "skill_name": "Metagenomics", "platform_group": "Domain"},
+    {"skill_id": "SK00137", "skill_name": "Protein Structure Modelling", "platform_group": "Domain"},
+    {"skill_id": "SK00138", "skill_name": "Single Cell Omics", "platform_group": "Domain"},
+    {"skill_id": "SK00139", "skill_name": "Vibration Analytics", "platform_group": "Domain"},
+    {"skill_id": "SK00140", "skill_name": "Business Intelligence", "platform_group": "Functional"},
+    {"skill_id": "SK00141", "skill_name": "Capacity Planning", "platform_group": "Functional"},
+    {"skill_id": "SK00142", "skill_name": "Data Architecture", "platform_group": "Functional"},
+    {"skill_id": "SK00143", "skill_name": "Data Engineering", "platform_group": "Functional"},
+    {"skill_id": "SK00144", "skill_name": "Data Governance", "platform_group": "Functional"},
+    {"skill_id": "SK00145", "skill_name": "Data Migration", "platform_group": "Functional"},
+    {"skill_id": "SK00146", "skill_name": "Data Modernization", "platform_group": "Functional"},
+    {"skill_id": "SK00147", "skill_name": "Designing scalable architecture", "platform_group": "Functional"},
+    {"skill_id": "SK00148", "skill_name": "End-to-end analytics solution designing", "platform_group": "Functional"},
+    {"skill_id": "SK00149", "skill_name": "Performance Optimization", "platform_group": "Functional"},
+    {"skill_id": "SK00150", "skill_name": "Root Cause Analysis", "platform_group": "Functional"},
+    {"skill_id": "SK00151", "skill_name": "Agile", "platform_group": "Soft"},
+    {"skill_id": "SK00152", "skill_name": "Consulting", "platform_group": "Soft"},
+    {"skill_id": "SK00153", "skill_name": "Insight generation", "platform_group": "Soft"},
+    {"skill_id": "SK00154", "skill_name": "Pre-Sales", "platform_group": "Soft"},
+    {"skill_id": "SK00155", "skill_name": "Product Management", "platform_group": "Soft"},
+    {"skill_id": "SK00156", "skill_name": "Requirement gathering", "platform_group": "Soft"},
+    {"skill_id": "SK00157", "skill_name": "Research manuscript writing", "platform_group": "Soft"},
+    {"skill_id": "SK00158", "skill_name": "Scrum planning", "platform_group": "Soft"},
+    {"skill_id": "SK00159", "skill_name": "Sprint planning", "platform_group": "Soft"},
+    {"skill_id": "SK00160", "skill_name": "Stakeholder management", "platform_group": "Soft"},
+    {"skill_id": "SK00161", "skill_name": "Team management", "platform_group": "Soft"},
+    {"skill_id": "SK00162", "skill_name": "PL/SQL", "platform_group": "SQL"},
+    {"skill_id": "SK00163", "skill_name": "SQL", "platform_group": "SQL"},
+    {"skill_id": "SK00164", "skill_name": "Spark SQL", "platform_group": "SQL"},
+    {"skill_id": "SK00165", "skill_name": "T-SQL", "platform_group": "SQL"},
+    {"skill_id": "SK00166", "skill_name": "ANSI SQL", "platform_group": "SQL"},
+    {"skill_id": "SK00167", "skill_name": "BigQuery SQL", "platform_group": "SQL"},
+    {"skill_id": "SK00168", "skill_name": "MySQL", "platform_group": "SQL"},
+    {"skill_id": "SK00169", "skill_name": "PostgreSQL", "platform_group": "SQL"},
+    {"skill_id": "SK00170", "skill_name": "Redshift SQL", "platform_group": "SQL"},
+    {"skill_id": "SK00171", "skill_name": "SQL Server", "platform_group": "SQL"},
+    {"skill_id": "SK00172", "skill_name": "Snowflake SQL", "platform_group": "SQL"},
+]
+
+# ─── Skills master helpers ───────────────────────────────────────────────────
+
+def _skill_master_lookup_by_name(name: str):
+    if not name:
+        return None
+    n = str(name).strip().lower()
+    if not n:
+        return None
+    for s in SKILLS_MASTER:
+        if s.get('skill_name', '').strip().lower() == n:
+            return s
+    return None
+
+def normalize_skills_list(skills):
+    """Normalize incoming/outgoing skills to structured objects.
+
+    Backward compatible with older entries like:
+    - "Python"
+    - {"skill_name": "Python", ...}
+    """
+    if not isinstance(skills, list):
+        return []
+
+    normalized = []
+    seen = set()
+
+    for item in skills:
+        if isinstance(item, str):
+            obj = {
+                'skill_id': None,
+                'skill_name': item,
+                'platform_group': None,
+                'primary_secondary': 'Primary',
+                'years_exp': '',
+                'self_assessment': '',
+            }
+        elif isinstance(item, dict):
+            obj = {
+                'skill_id': item.get('skill_id'),
+                'skill_name': item.get('skill_name') or item.get('name') or '',
+                'platform_group': item.get('platform_group'),
+                'primary_secondary': item.get('primary_secondary') or item.get('primary') or 'Primary',
+                'years_exp': item.get('years_exp', ''),
+                'self_assessment': item.get('self_assessment', ''),
+            }
+        else:
+            continue
+
+        # Enrich from master list if missing
+        if (not obj.get('skill_id') or not obj.get('platform_group')) and obj.get('skill_name'):
+            m = _skill_master_lookup_by_name(obj.get('skill_name'))
+            if m:
+                obj['skill_id'] = obj.get('skill_id') or m.get('skill_id')
+                obj['platform_group'] = obj.get('platform_group') or m.get('platform_group')
+
+        # Deduplicate
+        dedupe_key = (obj.get('skill_id') or obj.get('skill_name') or '').strip().lower()
+        if not dedupe_key or dedupe_key in seen:
+            continue
+        seen.add(dedupe_key)
+        normalized.append(obj)
+
+    return normalized
+
+# ─── Export formatting ───────────────────────────────────────────────────────
+
+def _safe_json_loads(val, default):
+    try:
+        if val is None:
+            return default
+        if isinstance(val, (list, dict)):
+            return val
+        s = str(val).strip()
+        if not s:
+            return default
+        return json.loads(s)
+    except Exception:
+        return default
+
+def _fmt_join(values):
+    parts = []
+    for v in values or []:
+        s = (str(v) if v is not None else '').strip()
+        if s:
+            parts.append(s)
+    return '; '.join(parts)
+
+def _fmt_education(education):
+    rows = []
+    for e in education or []:
+        if not isinstance(e, dict):
+            continue
+        degree = (e.get('degree') or '').strip()
+        spec = (e.get('specialisation') or '').strip()
+        inst = (e.get('institution') or '').strip()
+        year = (e.get('year') or '').strip()
+        grade = (e.get('grade') or '').strip()
+        line = ' | '.join([p for p in [degree, spec, inst, year, grade] if p])
+        if line:
+            rows.append(line)
+    return '\n'.join(rows)
+
+def _fmt_skills(skills):
+    skills_norm = normalize_skills_list(skills or [])
+    rows = []
+    for s in skills_norm:
+        if not isinstance(s, dict):
+            continue
+        skill_id = (s.get('skill_id') or '').strip()
+        name = (s.get('skill_name') or '').strip()
+        group = (s.get('platform_group') or '').strip()
+        ps = (s.get('primary_secondary') or '').strip()
+        years = (str(s.get('years_exp')) if s.get('years_exp') is not None else '').strip()
+        sa = (s.get('self_assessment') or '').strip()
+        main = ' '.join([p for p in [skill_id, name] if p]).strip()
+        meta = _fmt_join([group, ps, (f"{years}y" if years else ''), sa])
+        line = f"{main} — {meta}" if meta else main
+        if line:
+            rows.append(line)
+    return '\n'.join(rows)
+
+def _fmt_certs(certs):
+    rows = []
+    for c in certs or []:
+        if not isinstance(c, dict):
+            continue
+        name = (c.get('name') or '').strip()
+        provider = (c.get('provider') or '').strip()
+        date = (c.get('date') or '').strip()
+        expiry = (c.get('expiry') or '').strip()
+        meta = _fmt_join([provider, (f"Obtained: {date}" if date else ''), (f"Expiry: {expiry}" if expiry else '')])
+        line = f"{name} — {meta}" if meta else name
+        if line:
+            rows.append(line)
+    return '\n'.join(rows)
+
+def _fmt_projects(projects):
+    rows = []
+    for pr in projects or []:
+        if not isinstance(pr, dict):
+            continue
+        title = (pr.get('title') or '').strip()
+        role = (pr.get('role') or '').strip()
+        duration = (pr.get('duration') or '').strip()
+        tools = (pr.get('tools') or '').strip()
+        desc = (pr.get('description') or '').strip()
+        resp = (pr.get('responsibility') or '').strip()
+        awards = (pr.get('awards') or '').strip()
+        header = ' | '.join([p for p in [title, role, duration] if p]).strip()
+        details = []
+        if tools:
+            details.append(f"Tools: {tools}")
+        if desc:
+            details.append(f"Desc: {desc}")
+        if resp:
+            details.append(f"Resp: {resp}")
+        if awards:
+            details.append(f"Awards: {awards}")
+        if header and details:
+            rows.append(header + "\n" + '\n'.join(details))
+        elif header:
+            rows.append(header)
+        elif details:
+            rows.append('\n'.join(details))
+    return '\n\n'.join(rows)
+
+def _format_export_chunk(rows):
+    """Format raw EXPORT_COLUMNS tuples (plus a has-pic flag) into EXPORT_HEADERS rows.
+
+    Pure function of its input so it can run in a worker process.
+    """
+    out = []
+    for (hm_id, name, competency, joining_date,
+         total_y, total_m, rel_y, rel_m,
+         location_type, customer_name, customer_address, office_city,
+         primary_role, industries, education, skills, certs, projects,
+         approved, approved_at, created_at, updated_at, has_pic) in rows:
+        out.append([
+            hm_id, name, competency, joining_date,
+            total_y, total_m, rel_y, rel_m,
+            location_type, customer_name, customer_address, office_city,
+            primary_role, _fmt_join(_safe_json_loads(industries, [])),
+            _fmt_education(_safe_json_loads(education, [])),
+            _fmt_skills(_safe_json_loads(skills, [])),
+            _fmt_certs(_safe_json_loads(certs, [])),
+            _fmt_projects(_safe_json_loads(projects, [])),
+            bool(has_pic),
+            bool(approved),
+            approved_at.isoformat() if approved_at else '',
+            created_at.isoformat() if created_at else '',
+            updated_at.isoformat() if updated_at else ''
+        ])
+    return out
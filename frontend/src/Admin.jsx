@@ -21,6 +21,8 @@ function useAdmin() {
   };
 
   const logout = () => {
+    // Revoke server-side too; the local session is cleared regardless of the outcome.
+    if (token) fetch(`${API}/api/admin/logout`, { method: "POST", headers: { Authorization: `Bearer ${token}` } }).catch(() => { });
     localStorage.removeItem("admin_token");
     setToken("");
     setValid(false);
@@ -42,6 +44,7 @@ export default function Admin() {
   const [loginError, setLoginError] = useState("");
   const [profiles, setProfiles] = useState([]);
   const [stats, setStats] = useState(null);
+  const [trend, setTrend] = useState([]);
   const [search, setSearch] = useState("");
   const [page, setPage] = useState(1);
   const [totalPages, setTotalPages] = useState(1);
@@ -76,10 +79,24 @@ export default function Admin() {
     } catch { }
   };
 
+  const fetchTrend = async () => {
+    try {
+      const days = Array.from({ length: 30 }, (_, i) =>
+        new Date(Date.now() - (29 - i) * 24 * 3600 * 1000).toISOString().slice(0, 10));
+      const r = await authFetch(`${API}/api/admin/stats/timeseries?interval=day&start=${days[0]}`);
+      const byDay = Object.fromEntries(((await r.json()).series || []).map(d => [d.bucket, d]));
+      setTrend(days.map(bucket => byDay[bucket] || { bucket, submitted: 0, updated: 0, approved: 0 }));
+    } catch { }
+  };
+
   useEffect(() => {
     if (valid) { fetchProfiles(); fetchStats(); }
   }, [valid, page, search]);
 
+  useEffect(() => {
+    if (valid) fetchTrend();
+  }, [valid]);
+
   const deleteProfile = async (id) => {
     if (!confirm("Delete this profile?")) return;
     await authFetch(`${API}/api/admin/profiles/${id}`, { method: "DELETE" });
@@ -94,18 +111,19 @@ export default function Admin() {
       body: JSON.stringify({ approved }),
     });
     await fetchProfiles();
+    fetchTrend();
     if (selectedProfile?.id === profile.id) {
       setSelectedProfile(p => ({ ...p, approved }));
     }
   };
 
-  const exportFile = async (type) => {
+  const exportFile = async (type, filename = `profiles.${type}`) => {
     const r = await authFetch(`${API}/api/admin/export/${type}`);
     const blob = await r.blob();
     const url = URL.createObjectURL(blob);
     const a = document.createElement("a");
     a.href = url;
-    a.download = `profiles.${type}`;
+    a.download = filename;
     a.click();
   };
 
@@ -164,6 +182,32 @@ export default function Admin() {
         </div>
       )}
 
+      {/* Trend */}
+      {trend.length > 0 && (
+        <div className="max-w-7xl mx-auto px-4 pb-4">
+          <div className="bg-white rounded-lg shadow p-4">
+            <div className="flex items-center justify-between mb-3">
+              <div className="text-sm font-semibold text-gray-700">Last 30 days</div>
+              <div className="flex gap-3 text-xs text-gray-500">
+                <span className="flex items-center gap-1"><span className="w-2 h-2 bg-blue-500 inline-block rounded-sm" />Submitted</span>
+                <span className="flex items-center gap-1"><span className="w-2 h-2 bg-green-600 inline-block rounded-sm" />Approved</span>
+              </div>
+            </div>
+            <div className="flex items-end gap-1 h-24">
+              {(() => {
+                const max = Math.max(1, ...trend.map(d => Math.max(d.submitted, d.approved)));
+                return trend.map(d => (
+                  <div key={d.bucket} className="flex-1 flex items-end gap-px h-full" title={`${d.bucket}: ${d.submitted} submitted, ${d.updated} updated, ${d.approved} approved`}>
+                    <div className="flex-1 bg-blue-500 rounded-t" style={{ height: `${(d.submitted / max) * 100}%` }} />
+                    <div className="flex-1 bg-green-600 rounded-t" style={{ height: `${(d.approved / max) * 100}%` }} />
+                  </div>
+                ));
+              })()}
+            </div>
+          </div>
+        </div>
+      )}
+
       <div className="max-w-7xl mx-auto px-4 pb-8">
         {/* Toolbar */}
         <div className="flex flex-col md:flex-row gap-3 mb-4">
@@ -179,6 +223,10 @@ export default function Admin() {
               <svg className="w-4 h-4" fill="none" viewBox="0 0 24 24" stroke="currentColor"><path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M4 16v1a3 3 0 003 3h10a3 3 0 003-3v-1m-4-4l-4 4m0 0l-4-4m4 4V4" /></svg>
               Excel
             </button>
+            <button onClick={() => exportFile("parquet", "profiles_parquet.zip")} className="bg-gray-700 text-white px-4 py-2 rounded text-sm hover:bg-gray-800 flex items-center gap-2">
+              <svg className="w-4 h-4" fill="none" viewBox="0 0 24 24" stroke="currentColor"><path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M4 16v1a3 3 0 003 3h10a3 3 0 003-3v-1m-4-4l-4 4m0 0l-4-4m4 4V4" /></svg>
+              Parquet
+            </button>
           </div>
         </div>
 
@@ -2,6 +2,9 @@ import { useState, useEffect, useRef, useCallback } from "react";
 
 const API = import.meta.env.VITE_API_URL || "";
 
+const newIdempotencyKey = () =>
+  (window.crypto?.randomUUID ? window.crypto.randomUUID() : `${Date.now()}-${Math.random().toString(36).slice(2)}`);
+
 const COMPETENCIES = ["Intern", "Apprentice", "C1", "C2", "C3", "C4", "C5", "C6", "C7", "C8", "C9", "C10"];
 const PRIMARY_ROLES = ["Data Scientist", "Data Engineer", "ML Engineer", "Data Analyst", "AI Architect",
   "Platform Engineer", "Analytics Engineer", "Business Intelligence Developer", "Research Scientist"];
@@ -117,6 +120,10 @@ export default function App() {
     projects: [{ title: "", role: "", duration: "", tools: "", description: "", responsibility: "", awards: "" }],
   });
 
+  // Same key for double-clicks and retries of unchanged content; a new one after any edit.
+  const idempotencyKey = useRef(newIdempotencyKey());
+  useEffect(() => { idempotencyKey.current = newIdempotencyKey(); }, [profile]);
+
   const update = (field, value) => setProfile(p => ({ ...p, [field]: value }));
 
   const handlePicUpload = (e) => {
@@ -167,7 +174,7 @@ export default function App() {
     try {
       const r = await fetch(`${API}/api/profile`, {
         method: "POST",
-        headers: { "Content-Type": "application/json" },
+        headers: { "Content-Type": "application/json", "Idempotency-Key": idempotencyKey.current },
         body: JSON.stringify(profile),
       });
       if (!r.ok) { const d = await r.json(); throw new Error(d.error || "Submission failed"); }